@@ -5,110 +5,275 @@
 from typing import List, Dict
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import re
 import smtplib
-from jinja2 import Template
+import threading
+import logging
+
+from jinja2 import Environment
+from sqlalchemy import func, literal_column
+from sqlalchemy.orm import Session, joinedload
+
+from app.config import settings
+from app.db.models import Alert, Job, User
+
+logger = logging.getLogger(__name__)
+
+_EMAIL_TEMPLATE_SRC = """\
+<html>
+<body>
+    <h2>New Job Alerts for You!</h2>
+    <p>Hi there! We found some new jobs that match your interests:</p>
+
+    {% for job in jobs %}
+    <div style="border: 1px solid #ddd; padding: 15px; margin: 10px 0;">
+        <h3>{{ job.title }}</h3>
+        <p><strong>Department:</strong> {{ job.department }}</p>
+        <p><strong>Location:</strong> {{ job.location }}</p>
+        <p><strong>Deadline:</strong> {{ job.deadline_date.strftime('%Y-%m-%d') if job.deadline_date else 'Not specified' }}</p>
+        <p><strong>Description:</strong> {{ job.preview or '' }}...</p>
+        <p><a href="{{ job.application_link }}" style="background: #007bff; color: white; padding: 10px 15px; text-decoration: none;">Apply Now</a></p>
+    </div>
+    {% endfor %}
+
+    <p>Best regards,<br>BD Jobs Team</p>
+</body>
+</html>
+"""
+
+# Shared Jinja environment: the template is lexed/parsed/compiled exactly once
+# per process instead of once per AlertService instance.
+_JINJA_ENV = Environment(autoescape=True, auto_reload=False, cache_size=-1)
+_EMAIL_TEMPLATE = _JINJA_ENV.from_string(_EMAIL_TEMPLATE_SRC)
 
 class AlertService:
+    # Class attribute so all instances share the precompiled template
+    email_template = _EMAIL_TEMPLATE
+
     def __init__(self):
-        self.email_template = Template("""
-        <html>
-        <body>
-            <h2>New Job Alerts for You!</h2>
-            <p>Hi there! We found some new jobs that match your interests:</p>
-            
-            {% for job in jobs %}
-            <div style="border: 1px solid #ddd; padding: 15px; margin: 10px 0;">
-                <h3>{{ job.title }}</h3>
-                <p><strong>Department:</strong> {{ job.department }}</p>
-                <p><strong>Location:</strong> {{ job.location }}</p>
-                <p><strong>Deadline:</strong> {{ job.deadline_date.strftime('%Y-%m-%d') if job.deadline_date else 'Not specified' }}</p>
-                <p><strong>Description:</strong> {{ job.description[:200] }}...</p>
-                <p><a href="{{ job.application_link }}" style="background: #007bff; color: white; padding: 10px 15px; text-decoration: none;">Apply Now</a></p>
-            </div>
-            {% endfor %}
-            
-            <p>Best regards,<br>BD Jobs Team</p>
-        </body>
-        </html>
-        """)
-    
+        # Bounded worker pool so SMTP handshakes never block the scheduler
+        # event loop; each worker thread keeps its own long-lived connection.
+        self._smtp_pool = ThreadPoolExecutor(
+            max_workers=settings.SMTP_CONCURRENCY, thread_name_prefix="smtp"
+        )
+        self._smtp_local = threading.local()
+
+    def _connect_smtp(self) -> smtplib.SMTP:
+        """Open and authenticate an SMTP connection"""
+        server = smtplib.SMTP(settings.SMTP_SERVER, settings.SMTP_PORT)
+        server.starttls()
+        server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
+        return server
+
+    def _thread_server(self) -> smtplib.SMTP:
+        """Return this worker thread's persistent SMTP connection"""
+        server = getattr(self._smtp_local, "server", None)
+        if server is None:
+            server = self._smtp_local.server = self._connect_smtp()
+        return server
+
+    def _send_batch_sync(self, batch: List[tuple]) -> List[int]:
+        """Send prebuilt (alert, message) pairs over this thread's connection.
+
+        All MIME assembly happened up front, so the loop is pure SMTP
+        traffic on one persistent connection. If the connection drops
+        mid-batch, reconnect and resume from the first unsent message
+        instead of restarting the batch.
+        """
+        sent: List[int] = []
+        index = 0
+        reconnected = False
+        while index < len(batch):
+            alert, msg = batch[index]
+            try:
+                self._thread_server().send_message(msg)
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError):
+                if reconnected:
+                    logger.error(f"SMTP reconnect failed; {len(batch) - index} alerts unsent")
+                    break
+                logger.warning("SMTP connection lost, reconnecting")
+                # Drop the dead connection first, and never let a failed
+                # reconnect escape: the accumulated sent list must reach the
+                # caller so last_sent advances for what actually went out
+                self._smtp_local.server = None
+                try:
+                    self._smtp_local.server = self._connect_smtp()
+                except Exception as e:
+                    logger.error(
+                        f"SMTP reconnect failed: {e}; {len(batch) - index} alerts unsent"
+                    )
+                    break
+                reconnected = True
+                continue
+            except Exception as e:
+                logger.error(f"Failed to send alert {alert.id}: {e}")
+                index += 1
+                continue
+
+            sent.append(alert.id)
+            logger.info(f"Sent alert to user {alert.user_id}")
+            reconnected = False
+            index += 1
+
+        return sent
+
     async def check_and_send_alerts(self, db: Session):
         """Check for new jobs and send alerts"""
-        # Get all active alerts
-        alerts = db.query(Alert).filter(Alert.is_active == True).all()
-        
+        # Get all active alerts with their recipients eager-loaded in one query
+        alerts = (
+            db.query(Alert)
+            .options(joinedload(Alert.user))
+            .filter(Alert.is_active == True)
+            .all()
+        )
+        if not alerts:
+            return
+
+        # One loop-invariant "now": fewer clock reads, and a stable SQL
+        # parameter so the server reuses one prepared plan for all alerts
+        now = datetime.utcnow()
+
+        # Phase 1: DB matching and MIME assembly on the loop; collect
+        # (alert, prebuilt message) so workers do pure SMTP traffic
+        to_send = []
         for alert in alerts:
             try:
                 # Find matching jobs since last alert
-                last_sent = alert.last_sent or (datetime.utcnow() - timedelta(days=1))
-                matching_jobs = await self._find_matching_jobs(db, alert, last_sent)
-                
-                if matching_jobs:
-                    await self._send_email_alert(alert, matching_jobs)
-                    
-                    # Update last sent time
-                    alert.last_sent = datetime.utcnow()
-                    db.commit()
-                    
-                    logger.info(f"Sent alert to user {alert.user_id} with {len(matching_jobs)} jobs")
-                
+                last_sent = alert.last_sent or (now - timedelta(days=1))
+                matching_jobs = await self._find_matching_jobs(db, alert, last_sent, now)
+
+                if not matching_jobs:
+                    continue
+
+                user = alert.user
+                if not user or not user.email:
+                    continue
+
+                to_send.append((alert, self._build_message(user.email, matching_jobs)))
             except Exception as e:
                 logger.error(f"Failed to process alert {alert.id}: {e}")
-    
-    async def _find_matching_jobs(self, db: Session, alert: Alert, since: datetime) -> List[Job]:
-        """Find jobs matching alert criteria"""
-        query = db.query(Job).filter(
+                # A failed query aborts the transaction on PostgreSQL;
+                # without a rollback every later alert in this sweep (and
+                # the final last_sent commit) would fail too
+                db.rollback()
+
+        if not to_send:
+            return
+
+        # Phase 2: split the batch across SMTP_CONCURRENCY workers, each
+        # pipelining its share over one persistent connection off the loop
+        loop = asyncio.get_event_loop()
+        n_workers = min(settings.SMTP_CONCURRENCY, len(to_send))
+        batches = [to_send[i::n_workers] for i in range(n_workers)]
+
+        results = await asyncio.gather(*[
+            loop.run_in_executor(self._smtp_pool, self._send_batch_sync, batch)
+            for batch in batches
+        ])
+        sent_ids: List[int] = [alert_id for batch in results for alert_id in batch]
+
+        # One bulk UPDATE + one commit instead of a round-trip per alert
+        if sent_ids:
+            db.query(Alert).filter(Alert.id.in_(sent_ids)).update(
+                {Alert.last_sent: now}, synchronize_session=False
+            )
+            db.commit()
+
+    async def _find_matching_jobs(self, db: Session, alert: Alert, since: datetime,
+                                  now: datetime) -> List:
+        """Find jobs matching alert criteria.
+
+        Projects only the columns the email template renders, truncating
+        description to its 200-char preview in SQL so full TEXT bodies are
+        never transferred on this path.
+        """
+        keywords = []
+        if alert.keywords:
+            keywords = [k.strip() for k in alert.keywords.split(',') if k.strip()]
+
+        is_postgres = db.get_bind().dialect.name == "postgresql"
+        # Without FTS, keyword matching happens in Python against the full
+        # description, so only then is the whole TEXT column projected
+        regex_fallback = bool(keywords) and not is_postgres
+
+        columns = [
+            Job.id,
+            Job.title,
+            Job.department,
+            Job.location,
+            Job.deadline_date,
+            Job.application_link,
+            func.substr(Job.description, 1, 200).label('preview'),
+        ]
+        if regex_fallback:
+            columns.append(Job.description)
+
+        query = db.query(*columns).filter(
             Job.created_at >= since,
             Job.is_active == True,
-            Job.deadline_date >= datetime.utcnow()
+            Job.deadline_date >= now
         )
-        
+
         # Apply filters based on alert criteria
         if alert.location:
             query = query.filter(Job.location.ilike(f"%{alert.location}%"))
-        
+
         if alert.department:
             query = query.filter(Job.department.ilike(f"%{alert.department}%"))
-        
-        if alert.keywords:
-            keywords = [k.strip() for k in alert.keywords.split(',')]
-            keyword_filters = []
-            for keyword in keywords:
-                keyword_filters.append(Job.title.ilike(f"%{keyword}%"))
-                keyword_filters.append(Job.description.ilike(f"%{keyword}%"))
-            
-            query = query.filter(or_(*keyword_filters))
-        
+
+        if keywords and is_postgres:
+            # Collapse the keyword list into one tsquery against the stored
+            # search_tsv column (maintained by scripts/setup_db.py): a
+            # single GIN-indexed lookup instead of 2*N ILIKE scans.
+            # Keywords with no word characters sanitize to nothing; they
+            # must not reach the join or to_tsquery raises a syntax error
+            branches = [
+                branch for branch in (
+                    re.sub(r'\W+', ' ', keyword).strip().replace(' ', ' & ')
+                    for keyword in keywords
+                ) if branch
+            ]
+            if branches:
+                tsq = ' | '.join(branches)
+                tsvector = literal_column('jobs.search_tsv')
+                query = query.filter(tsvector.op('@@')(func.to_tsquery('english', tsq)))
+
+        if regex_fallback:
+            # One precompiled alternation regex scans each candidate once
+            # instead of 2*N ILIKE predicates per row
+            pattern = re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+            matches = []
+            for row in query.limit(200):
+                if pattern.search(row.title) or (
+                    row.description and pattern.search(row.description)
+                ):
+                    matches.append(row)
+                    if len(matches) == 10:  # Limit to avoid spam
+                        break
+            return matches
+
         return query.limit(10).all()  # Limit to avoid spam
-    
-    async def _send_email_alert(self, alert: Alert, jobs: List[Job]):
-        """Send email alert to user"""
-        try:
-            # Get user email
-            user = db.query(User).filter(User.id == alert.user_id).first()
-            if not user or not user.email:
-                return
-            
-            # Prepare email
-            subject = f"New Job Alert: {len(jobs)} matching jobs found"
-            html_content = self.email_template.render(jobs=jobs)
-            
-            # Send email
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = settings.FROM_EMAIL
-            msg['To'] = user.email
-            
-            html_part = MIMEText(html_content, 'html')
-            msg.attach(html_part)
-            
-            # SMTP connection
-            with smtplib.SMTP(settings.SMTP_SERVER, settings.SMTP_PORT) as server:
-                server.starttls()
-                server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
-                server.send_message(msg)
-            
-            logger.info(f"Email sent to {user.email}")
-            
-        except Exception as e:
-            logger.error(f"Failed to send email alert: {e}")
+
+    def _build_message(self, user_email: str, jobs: List) -> MIMEMultipart:
+        """Render and assemble one alert message (no I/O)"""
+        subject = f"New Job Alert: {len(jobs)} matching jobs found"
+        html_content = self.email_template.render(jobs=jobs)
+
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = subject
+        msg['From'] = settings.FROM_EMAIL
+        msg['To'] = user_email
+
+        html_part = MIMEText(html_content, 'html')
+        msg.attach(html_part)
+
+        return msg
+
+    def _send_email_alert(self, server: smtplib.SMTP, user_email: str, jobs: List):
+        """Send email alert over an already-connected SMTP server"""
+        server.send_message(self._build_message(user_email, jobs))
+
+        logger.info(f"Email sent to {user_email}")
@@ -2,10 +2,21 @@
 # 13. Scheduler (app/alerts/scheduler.py)
 # =============================================================================
 
+from datetime import datetime, timedelta
+import logging
+
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
+from app.alerts.alert_service import AlertService
+from app.cache.redis_cache import cache
+from app.db.database import db_manager
+from app.db.models import Job
+from app.scrapers.scraper_manager import ScraperManager
+
+logger = logging.getLogger(__name__)
+
 class JobScheduler:
     def __init__(self):
         self.scheduler = AsyncIOScheduler()
@@ -80,7 +91,11 @@ class JobScheduler:
                 
                 db.commit()
                 logger.info(f"Deactivated {updated} old jobs")
-                
+
+                # Deactivations change listing results; drop cached pages
+                if updated:
+                    await cache.delete_pattern("jobs_*")
+
         except Exception as e:
             logger.error(f"Cleanup failed: {e}")
 
@@ -4,6 +4,7 @@
 
 from fastapi import APIRouter, Depends, Request, HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql, sqlite
 from typing import List
 from datetime import datetime
 from pydantic import BaseModel
@@ -17,6 +18,12 @@ from app.db.models import Job, User, Bookmark
 
 bookmark_router = APIRouter(prefix="/bookmarks", tags=["bookmarks"])
 
+def _insert_ignore(db: Session, model):
+    """Dialect-appropriate INSERT supporting ON CONFLICT DO NOTHING"""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
 class BookmarkRequest(BaseModel):
     user_id: str
     job_id: int
@@ -39,34 +46,39 @@ async def create_bookmark(
     db: Session = Depends(db_manager.get_db)
 ):
     """Create a job bookmark"""
-    
-    # Get or create user
-    user = db.query(User).filter(User.user_id == bookmark_data.user_id).first()
-    if not user:
-        user = User(user_id=bookmark_data.user_id)
-        db.add(user)
-        db.commit()
-        db.refresh(user)
-    
-    # Check if job exists
-    job = db.query(Job).filter(Job.id == bookmark_data.job_id).first()
-    if not job:
+
+    # Check if job exists (cheap keyed lookup, no row materialization)
+    if db.query(Job.id).filter(Job.id == bookmark_data.job_id).scalar() is None:
         raise HTTPException(status_code=404, detail="Job not found")
-    
-    # Check if bookmark already exists
-    existing_bookmark = db.query(Bookmark).filter(
-        Bookmark.user_id == user.id,
-        Bookmark.job_id == bookmark_data.job_id
-    ).first()
-    
-    if existing_bookmark:
-        raise HTTPException(status_code=400, detail="Job already bookmarked")
-    
-    # Create bookmark
-    bookmark = Bookmark(user_id=user.id, job_id=bookmark_data.job_id)
-    db.add(bookmark)
+
+    # Upsert user in one statement; the unique index resolves races
+    user_insert = (
+        _insert_ignore(db, User)
+        .values(user_id=bookmark_data.user_id)
+        .on_conflict_do_nothing(index_elements=['user_id'])
+        .returning(User.id)
+    )
+    row = db.execute(user_insert).first()
+    user_pk = row[0] if row else db.query(User.id).filter(
+        User.user_id == bookmark_data.user_id
+    ).scalar()
+
+    # Insert bookmark; the unique (user_id, job_id) index enforces
+    # no-duplicates in the DB, closing the SELECT-then-INSERT race
+    bookmark_insert = (
+        _insert_ignore(db, Bookmark)
+        .values(user_id=user_pk, job_id=bookmark_data.job_id)
+        .on_conflict_do_nothing(index_elements=['user_id', 'job_id'])
+        .returning(Bookmark.id)
+    )
+    inserted = db.execute(bookmark_insert).first()
     db.commit()
-    
+
+    if inserted is None:
+        raise HTTPException(status_code=400, detail="Job already bookmarked")
+
+    await cache.delete(f"bookmarks_{bookmark_data.user_id}")
+
     return {"message": "Bookmark created successfully"}
 
 @bookmark_router.get("/", response_model=List[BookmarkResponse])
@@ -77,13 +89,23 @@ async def get_bookmarks(
     db: Session = Depends(db_manager.get_db)
 ):
     """Get user's bookmarks"""
-    
+
+    cache_key = f"bookmarks_{user_id}"
+    cached_bookmarks = await cache.get(cache_key)
+    if cached_bookmarks is not None:
+        return cached_bookmarks
+
     user = db.query(User).filter(User.user_id == user_id).first()
     if not user:
         return []
-    
+
     bookmarks = db.query(Bookmark).filter(Bookmark.user_id == user.id).all()
-    return bookmarks
+
+    # Cache plain dicts; bookmark writes invalidate this key explicitly
+    payload = [BookmarkResponse.model_validate(b).model_dump(mode='json') for b in bookmarks]
+    await cache.set(cache_key, payload, ttl=3600)
+
+    return payload
 
 @bookmark_router.delete("/{bookmark_id}")
 @limiter.limit("20/minute")
@@ -94,20 +116,23 @@ async def delete_bookmark(
     db: Session = Depends(db_manager.get_db)
 ):
     """Delete a bookmark"""
-    
-    user = db.query(User).filter(User.user_id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    bookmark = db.query(Bookmark).filter(
-        Bookmark.id == bookmark_id,
-        Bookmark.user_id == user.id
-    ).first()
-    
-    if not bookmark:
-        raise HTTPException(status_code=404, detail="Bookmark not found")
-    
-    db.delete(bookmark)
+
+    # Single DELETE with the owner resolved via subquery: one round-trip
+    deleted = (
+        db.query(Bookmark)
+        .filter(
+            Bookmark.id == bookmark_id,
+            Bookmark.user_id == db.query(User.id).filter(
+                User.user_id == user_id
+            ).scalar_subquery(),
+        )
+        .delete(synchronize_session=False)
+    )
     db.commit()
-    
+
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Bookmark not found")
+
+    await cache.delete(f"bookmarks_{user_id}")
+
     return {"message": "Bookmark deleted successfully"}
\ No newline at end of file
@@ -2,24 +2,62 @@
 # 14. Export Routes (app/api/routes/export.py)
 # =============================================================================
 
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
+from sqlalchemy import func
 from typing import Optional
 from datetime import datetime
 
 from app.main import limiter
+from app.cache.redis_cache import cache
 from app.db.database import db_manager
 from app.db.models import Job
 from fastapi.responses import StreamingResponse
 import csv
+import hashlib
 import json
 import io
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
 from reportlab.lib.styles import getSampleStyleSheet
 
+try:
+    import orjson
+
+    def _json_row(row: dict) -> bytes:
+        return orjson.dumps(row)
+except ImportError:
+    def _json_row(row: dict) -> bytes:
+        return json.dumps(row).encode()
+
 export_router = APIRouter(prefix="/export", tags=["export"])
 
+async def _jobs_etag(db: Session, **filters) -> str:
+    """Weak ETag derived from the newest job row plus the filter set.
+
+    MAX(updated_at) is cached briefly so repeat clients revalidating with
+    If-None-Match don't cost a DB query each time. The cache key sits under
+    the jobs_* pattern, so job writes also invalidate it immediately.
+    """
+    max_updated = await cache.get("jobs_max_updated")
+    if max_updated is None:
+        max_updated = str(db.query(func.max(Job.updated_at)).scalar())
+        await cache.set("jobs_max_updated", max_updated, ttl=10)
+
+    fingerprint = json.dumps(filters, sort_keys=True, default=str)
+    digest = hashlib.blake2b(
+        f"{max_updated}|{fingerprint}".encode(), digest_size=8
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+_EXPORT_CACHE_HEADERS = {"Cache-Control": "private, max-age=60"}
+
+_CSV_HEADERS = [
+    'Title', 'Department', 'Location', 'Grade', 'Salary',
+    'Vacancies', 'Education', 'Experience', 'Skills',
+    'Deadline', 'Application Link'
+]
+
 @export_router.get("/csv")
 @limiter.limit("10/minute")
 async def export_jobs_csv(
@@ -30,7 +68,12 @@ async def export_jobs_csv(
     db: Session = Depends(db_manager.get_db)
 ):
     """Export jobs to CSV format"""
-    
+
+    # Short-circuit unchanged data before touching the jobs table
+    etag = await _jobs_etag(db, fmt="csv", title=title, department=department, location=location)
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304)
+
     # Build query with filters
     query = db.query(Job).filter(
         Job.is_active == True,
@@ -44,35 +87,36 @@ async def export_jobs_csv(
     if location:
         query = query.filter(Job.location.ilike(f"%{location}%"))
     
-    jobs = query.limit(1000).all()  # Limit export size
-    
-    # Create CSV
-    output = io.StringIO()
-    writer = csv.writer(output)
-    
-    # Headers
-    writer.writerow([
-        'Title', 'Department', 'Location', 'Grade', 'Salary', 
-        'Vacancies', 'Education', 'Experience', 'Skills',
-        'Deadline', 'Application Link'
-    ])
-    
-    # Data rows
-    for job in jobs:
-        writer.writerow([
-            job.title, job.department, job.location, job.grade,
-            job.salary, job.vacancies, job.education, job.experience,
-            ', '.join(job.skills) if job.skills else '',
-            job.deadline_date.strftime('%Y-%m-%d') if job.deadline_date else '',
-            job.application_link
-        ])
-    
-    output.seek(0)
-    
+    query = query.limit(1000)  # Limit export size
+
+    # Stream rows as the DB yields them instead of buffering the whole CSV
+    def row_iter():
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+
+        writer.writerow(_CSV_HEADERS)
+        yield buf.getvalue().encode()
+
+        for job in query.yield_per(200):
+            buf.seek(0)
+            buf.truncate()
+            writer.writerow([
+                job.title, job.department, job.location, job.grade,
+                job.salary, job.vacancies, job.education, job.experience,
+                ', '.join(job.skills) if job.skills else '',
+                job.deadline_date.strftime('%Y-%m-%d') if job.deadline_date else '',
+                job.application_link
+            ])
+            yield buf.getvalue().encode()
+
     return StreamingResponse(
-        io.BytesIO(output.getvalue().encode()),
+        row_iter(),
         media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=bd_jobs.csv"}
+        headers={
+            "Content-Disposition": "attachment; filename=bd_jobs.csv",
+            "ETag": etag,
+            **_EXPORT_CACHE_HEADERS,
+        }
     )
 
 @export_router.get("/json")
@@ -85,7 +129,12 @@ async def export_jobs_json(
     db: Session = Depends(db_manager.get_db)
 ):
     """Export jobs to JSON format"""
-    
+
+    # Short-circuit unchanged data before touching the jobs table
+    etag = await _jobs_etag(db, fmt="json", title=title, department=department, location=location)
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304)
+
     # Similar query logic as CSV
     query = db.query(Job).filter(
         Job.is_active == True,
@@ -99,32 +148,40 @@ async def export_jobs_json(
     if location:
         query = query.filter(Job.location.ilike(f"%{location}%"))
     
-    jobs = query.limit(1000).all()
-    
-    # Convert to dict
-    jobs_data = []
-    for job in jobs:
-        job_dict = {
-            'title': job.title,
-            'department': job.department,
-            'location': job.location,
-            'grade': job.grade,
-            'salary': job.salary,
-            'vacancies': job.vacancies,
-            'education': job.education,
-            'experience': job.experience,
-            'skills': job.skills,
-            'description': job.description,
-            'deadline_date': job.deadline_date.isoformat() if job.deadline_date else None,
-            'application_link': job.application_link,
-            'created_at': job.created_at.isoformat()
-        }
-        jobs_data.append(job_dict)
-    
-    json_data = json.dumps(jobs_data, indent=2)
-    
+    query = query.limit(1000)
+
+    # Stream a JSON array one row at a time with manual framing
+    def row_iter():
+        yield b'['
+        first = True
+        for job in query.yield_per(200):
+            job_dict = {
+                'title': job.title,
+                'department': job.department,
+                'location': job.location,
+                'grade': job.grade,
+                'salary': job.salary,
+                'vacancies': job.vacancies,
+                'education': job.education,
+                'experience': job.experience,
+                'skills': job.skills,
+                'description': job.description,
+                'deadline_date': job.deadline_date.isoformat() if job.deadline_date else None,
+                'application_link': job.application_link,
+                'created_at': job.created_at.isoformat()
+            }
+            if not first:
+                yield b','
+            first = False
+            yield _json_row(job_dict)
+        yield b']'
+
     return StreamingResponse(
-        io.BytesIO(json_data.encode()),
+        row_iter(),
         media_type="application/json",
-        headers={"Content-Disposition": "attachment; filename=bd_jobs.json"}
+        headers={
+            "Content-Disposition": "attachment; filename=bd_jobs.json",
+            "ETag": etag,
+            **_EXPORT_CACHE_HEADERS,
+        }
     )
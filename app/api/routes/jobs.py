@@ -4,10 +4,12 @@
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, func, literal_column
 from typing import Optional, List
 from pydantic import BaseModel
 from datetime import datetime, timedelta
+import hashlib
+import json
 from app.main import limiter
 from app.db.database import db_manager
 from app.cache.redis_cache import cache
@@ -40,6 +42,40 @@ class JobResponse(BaseModel):
     class Config:
         from_attributes = True
 
+def _cache_key(endpoint: str, **params) -> str:
+    """Build a constant-size cache key for an endpoint plus its filters.
+
+    Hashing avoids both ambiguity (f-string keys collide when filter values
+    contain the separator) and unbounded key length when callers pass long
+    strings. The jobs_ prefix keeps keys under the pattern that job writes
+    invalidate.
+    """
+    digest = hashlib.blake2b(
+        json.dumps(params, sort_keys=True, default=str).encode(),
+        digest_size=16,
+    ).hexdigest()
+    return f"jobs_{endpoint}_{digest}"
+
+def _search_criterion(db: Session, term: str):
+    """Build the search predicate for a free-text query.
+
+    On PostgreSQL this searches the stored ``search_tsv`` generated column
+    (maintained by scripts/setup_db.py), which tokenizes the same four
+    fields as the fallback — title, department, description, location — so
+    the GIN index serves the lookup without re-tokenizing per row. Other
+    dialects (e.g. SQLite in tests) fall back to the ILIKE OR-chain.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        tsvector = literal_column('jobs.search_tsv')
+        return tsvector.op('@@')(func.websearch_to_tsquery('english', term))
+
+    return or_(
+        Job.title.ilike(f"%{term}%"),
+        Job.department.ilike(f"%{term}%"),
+        Job.description.ilike(f"%{term}%"),
+        Job.location.ilike(f"%{term}%")
+    )
+
 class JobFilter(BaseModel):
     title: Optional[str] = None
     department: Optional[str] = None
@@ -62,38 +98,47 @@ async def get_jobs(
 ):
     """Get jobs with optional filtering"""
     
-    # Check cache first
-    cache_key = f"jobs_{skip}_{limit}_{title}_{department}_{location}_{active_only}"
-    cached_jobs = await cache.get(cache_key)
-    if cached_jobs:
-        return cached_jobs
-    
-    # Build query
-    query = db.query(Job)
-    
-    if active_only:
-        query = query.filter(Job.is_active == True)
-        query = query.filter(Job.deadline_date >= datetime.utcnow())
-    
-    if title:
-        query = query.filter(Job.title.ilike(f"%{title}%"))
-    
-    if department:
-        query = query.filter(Job.department.ilike(f"%{department}%"))
-    
-    if location:
-        query = query.filter(Job.location.ilike(f"%{location}%"))
-    
-    # Order by creation date (newest first)
-    query = query.order_by(Job.created_at.desc())
-    
-    # Pagination
-    jobs = query.offset(skip).limit(limit).all()
-    
-    # Cache results
-    await cache.set(cache_key, jobs, ttl=300)  # 5 minutes
-    
-    return jobs
+    cache_key = _cache_key(
+        "list", skip=skip, limit=limit, title=title,
+        department=department, location=location, active_only=active_only,
+    )
+
+    async def load_jobs():
+        # Build query
+        query = db.query(Job)
+
+        if active_only:
+            query = query.filter(Job.is_active == True)
+            query = query.filter(Job.deadline_date >= datetime.utcnow())
+
+        if title:
+            query = query.filter(Job.title.ilike(f"%{title}%"))
+
+        if department:
+            query = query.filter(Job.department.ilike(f"%{department}%"))
+
+        if location:
+            query = query.filter(Job.location.ilike(f"%{location}%"))
+
+        # Order by creation date (newest first)
+        query = query.order_by(Job.created_at.desc())
+
+        # Pagination
+        jobs = query.offset(skip).limit(limit).all()
+
+        # Cache plain dicts (JSON-serializable, unlike detached ORM instances)
+        payload = [JobResponse.model_validate(job).model_dump(mode='json') for job in jobs]
+
+        # Warm the per-job cache in one pipelined round-trip so follow-up
+        # get_job hits for listed jobs skip the DB entirely
+        if payload:
+            await cache.set_many({f"job_{row['id']}": row for row in payload}, ttl=3600)
+
+        return payload
+
+    # Single-flight: concurrent misses on the same key share one DB query.
+    # Long TTL is safe because job writes invalidate jobs_* explicitly.
+    return await cache.get_or_load(cache_key, load_jobs, ttl=3600)
 
 @router.get("/{job_id}", response_model=JobResponse)
 @limiter.limit("200/minute")
@@ -104,20 +149,17 @@ async def get_job(
 ):
     """Get specific job by ID"""
     
-    # Check cache
     cache_key = f"job_{job_id}"
-    cached_job = await cache.get(cache_key)
-    if cached_job:
-        return cached_job
-    
-    job = db.query(Job).filter(Job.id == job_id).first()
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    # Cache result
-    await cache.set(cache_key, job, ttl=3600)  # 1 hour
-    
-    return job
+
+    async def load_job():
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        # Cache result as a plain dict
+        return JobResponse.model_validate(job).model_dump(mode='json')
+
+    return await cache.get_or_load(cache_key, load_job, ttl=3600)  # 1 hour
 
 @router.get("/search/{query}")
 @limiter.limit("50/minute")
@@ -129,18 +171,18 @@ async def search_jobs(
     db: Session = Depends(db_manager.get_db)
 ):
     """Full-text search across jobs"""
-    
-    search_query = db.query(Job).filter(
-        or_(
-            Job.title.ilike(f"%{query}%"),
-            Job.department.ilike(f"%{query}%"),
-            Job.description.ilike(f"%{query}%"),
-            Job.location.ilike(f"%{query}%")
-        )
-    ).filter(
-        Job.is_active == True,
-        Job.deadline_date >= datetime.utcnow()
-    ).order_by(Job.created_at.desc())
-    
-    jobs = search_query.offset(skip).limit(limit).all()
-    return jobs
\ No newline at end of file
+
+    cache_key = _cache_key("search", query=query, skip=skip, limit=limit)
+
+    async def load_results():
+        search_query = db.query(Job).filter(
+            _search_criterion(db, query)
+        ).filter(
+            Job.is_active == True,
+            Job.deadline_date >= datetime.utcnow()
+        ).order_by(Job.created_at.desc())
+
+        jobs = search_query.offset(skip).limit(limit).all()
+        return [JobResponse.model_validate(job).model_dump(mode='json') for job in jobs]
+
+    return await cache.get_or_load(cache_key, load_results, ttl=3600)
\ No newline at end of file
@@ -2,10 +2,13 @@
 # 4. Redis Cache (app/cache/redis_cache.py)
 # =============================================================================
 
-import redis
 import json
-from typing import Any, Optional
-import pickle
+import time
+import asyncio
+import fnmatch
+from typing import Any, Callable, Dict, List, Optional
+
+from redis import asyncio as aioredis
 from datetime import timedelta
 import logging
 
@@ -13,67 +16,274 @@ from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# orjson serializes plain dict/list payloads several times faster than the
+# stdlib and, unlike the previous pickle approach, is safe across code
+# changes (pickled detached ORM instances could not be reliably reloaded).
+try:
+    import orjson
+
+    def _dumps(value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value, default=str).encode()
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
 class RedisCache:
     def __init__(self, redis_url: str):
-        self.redis_client = redis.from_url(redis_url, decode_responses=False)
-    
+        # Async client: cache round-trips await instead of stalling the
+        # FastAPI event loop for the network RTT
+        self.redis_client = aioredis.from_url(redis_url, decode_responses=False)
+
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache"""
         try:
-            value = self.redis_client.get(key)
+            value = await self.redis_client.get(key)
             if value:
-                return pickle.loads(value)
+                return _loads(value)
         except Exception as e:
             logger.error(f"Redis get error: {e}")
         return None
-    
+
     async def set(self, key: str, value: Any, ttl: int = 3600):
         """Set value in cache with TTL"""
         try:
-            serialized = pickle.dumps(value)
-            self.redis_client.setex(key, ttl, serialized)
+            serialized = _dumps(value)
+            await self.redis_client.setex(key, ttl, serialized)
         except Exception as e:
             logger.error(f"Redis set error: {e}")
-    
+
     async def delete(self, key: str):
         """Delete key from cache"""
         try:
-            self.redis_client.delete(key)
+            await self.redis_client.delete(key)
         except Exception as e:
             logger.error(f"Redis delete error: {e}")
-    
+
     async def exists(self, key: str) -> bool:
         """Check if key exists"""
         try:
-            return bool(self.redis_client.exists(key))
+            return bool(await self.redis_client.exists(key))
         except Exception as e:
             logger.error(f"Redis exists error: {e}")
             return False
 
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values in one round-trip"""
+        try:
+            values = await self.redis_client.mget(keys)
+            return [_loads(v) if v else None for v in values]
+        except Exception as e:
+            logger.error(f"Redis mget error: {e}")
+            return [None] * len(keys)
+
+    async def set_many(self, items: Dict[str, Any], ttl: int = 3600):
+        """Set several values with one pipelined round-trip"""
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.setex(key, ttl, _dumps(value))
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Redis set_many error: {e}")
+
+    async def delete_pattern(self, pattern: str):
+        """Delete all keys matching a glob pattern.
+
+        Uses incremental SCAN + UNLINK (non-blocking delete) rather than
+        KEYS, which would block Redis on a large keyspace.
+        """
+        try:
+            async for key in self.redis_client.scan_iter(match=pattern, count=500):
+                await self.redis_client.unlink(key)
+        except Exception as e:
+            logger.error(f"Redis delete_pattern error: {e}")
+
+class TwoLevelCache:
+    """In-process TTL tier in front of the Redis cache.
+
+    Hot keys (e.g. the first pages of the jobs listing) are answered from a
+    local dict (~100ns) instead of paying the Redis round-trip on every
+    request. The fast tier has a short TTL so invalidation still effectively
+    happens through Redis expiry.
+    """
+
+    def __init__(self, backend: RedisCache, fast_ttl: float = 1.0, max_entries: int = 512):
+        self.backend = backend
+        self.fast_ttl = fast_ttl
+        self.max_entries = max_entries
+        self._fast = {}  # key -> (expires_at, value)
+        self._inflight = {}  # key -> Future for a load already in progress
+
+    def _store_fast(self, key: str, value: Any):
+        if len(self._fast) >= self.max_entries:
+            # Evict the oldest half; dicts preserve insertion order
+            for stale in list(self._fast)[:self.max_entries // 2]:
+                del self._fast[stale]
+        self._fast[key] = (time.monotonic() + self.fast_ttl, value)
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get value, preferring the in-process tier"""
+        entry = self._fast.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                return entry[1]
+            del self._fast[key]
+
+        value = await self.backend.get(key)
+        if value is not None:
+            self._store_fast(key, value)
+        return value
+
+    async def get_or_load(self, key: str, loader: Callable, ttl: int = 3600) -> Any:
+        """Get value, running ``loader`` on a miss with single-flight semantics.
+
+        Concurrent callers missing on the same key await one shared load
+        instead of each hitting the database and re-setting the same entry.
+        """
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            return await inflight
+
+        future = asyncio.get_event_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+            await self.set(key, value, ttl)
+            future.set_result(value)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved; waiters still re-raise on await
+            raise
+        finally:
+            del self._inflight[key]
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int = 3600):
+        """Set value in both tiers"""
+        self._store_fast(key, value)
+        await self.backend.set(key, value, ttl)
+
+    async def delete(self, key: str):
+        """Delete key from both tiers"""
+        self._fast.pop(key, None)
+        await self.backend.delete(key)
+
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values, batching fast-tier misses into one backend call"""
+        now = time.monotonic()
+        results: List[Optional[Any]] = [None] * len(keys)
+        missing = []
+        for i, key in enumerate(keys):
+            entry = self._fast.get(key)
+            if entry is not None and entry[0] > now:
+                results[i] = entry[1]
+            else:
+                missing.append(i)
+
+        if missing:
+            fetched = await self.backend.mget([keys[i] for i in missing])
+            for i, value in zip(missing, fetched):
+                if value is not None:
+                    results[i] = value
+                    self._store_fast(keys[i], value)
+        return results
+
+    async def set_many(self, items: Dict[str, Any], ttl: int = 3600):
+        """Set several values in both tiers with one backend round-trip"""
+        for key, value in items.items():
+            self._store_fast(key, value)
+        await self.backend.set_many(items, ttl)
+
+    async def delete_pattern(self, pattern: str):
+        """Delete all keys matching a glob pattern from both tiers"""
+        for key in [k for k in self._fast if fnmatch.fnmatch(k, pattern)]:
+            del self._fast[key]
+        await self.backend.delete_pattern(pattern)
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists in either tier"""
+        entry = self._fast.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return True
+        return await self.backend.exists(key)
+
 # Initialize cache if REDIS_URL is configured, otherwise create a no-op cache
 try:
     if settings.REDIS_URL:
-        cache = RedisCache(settings.REDIS_URL)
+        cache = TwoLevelCache(RedisCache(settings.REDIS_URL))
     else:
         raise RuntimeError("No REDIS_URL configured")
 except Exception:
     logger.warning("Redis not configured or failed to initialize; using in-memory fallback")
 
     class _InMemoryCache(RedisCache):
+        """Bounded TTL dict standing in for Redis in dev/test runs.
+
+        Entries expire like Redis keys and the store is capped so a
+        long-running worker under miss traffic can't grow without bound.
+        All access happens on the event loop, so no lock is needed.
+        """
+
+        max_entries = 10000
+
         def __init__(self):
-            self._store = {}
+            self._store = {}  # key -> (expires_at, value)
+
+        def _evict(self):
+            now = time.monotonic()
+            for key in [k for k, (exp, _) in self._store.items() if exp <= now]:
+                del self._store[key]
+            if len(self._store) >= self.max_entries:
+                # Evict the oldest half; dicts preserve insertion order
+                for stale in list(self._store)[:self.max_entries // 2]:
+                    del self._store[stale]
 
         async def get(self, key: str):
-            return self._store.get(key)
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._store[key]
+                return None
+            return entry[1]
 
         async def set(self, key: str, value: Any, ttl: int = 3600):
-            self._store[key] = value
+            if len(self._store) >= self.max_entries:
+                self._evict()
+            self._store[key] = (time.monotonic() + ttl, value)
 
         async def delete(self, key: str):
-            if key in self._store:
-                del self._store[key]
+            self._store.pop(key, None)
 
         async def exists(self, key: str) -> bool:
-            return key in self._store
+            return await self.get(key) is not None
+
+        async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+            return [await self.get(key) for key in keys]
+
+        async def set_many(self, items: Dict[str, Any], ttl: int = 3600):
+            for key, value in items.items():
+                await self.set(key, value, ttl)
+
+        async def delete_pattern(self, pattern: str):
+            for key in [k for k in self._store if fnmatch.fnmatch(k, pattern)]:
+                del self._store[key]
+
+        async def get_or_load(self, key: str, loader: Callable, ttl: int = 3600) -> Any:
+            value = await self.get(key)
+            if value is None:
+                value = await loader()
+                await self.set(key, value, ttl)
+            return value
 
     cache = _InMemoryCache()
\ No newline at end of file
@@ -25,6 +25,7 @@ class Settings(BaseSettings):
     SMTP_USERNAME: str = ""
     SMTP_PASSWORD: str = ""
     FROM_EMAIL: str = ""
+    SMTP_CONCURRENCY: int = 5  # Parallel SMTP sessions (respect provider limits)
     
     # Logging
     LOG_LEVEL: str = "INFO"
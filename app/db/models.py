@@ -4,6 +4,7 @@
 # =============================================================================
 
 from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, ForeignKey, Index, JSON
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -30,8 +31,17 @@ class Job(Base):
     age_max = Column(Integer)
     
     # Skills and requirements
-    skills = Column(JSON)  # List of extracted skills
+    # Native text[] on PostgreSQL: denser than JSON and GIN-indexable for
+    # containment queries (Job.skills.contains(['Python'])); other dialects
+    # keep the JSON representation
+    skills = Column(JSON().with_variant(ARRAY(String(64)), 'postgresql'))
     description = Column(Text)
+    # On PostgreSQL the table also carries `search_tsv`, a stored generated
+    # tsvector over title+department+description+location with a GIN index
+    # (added by scripts/setup_db.py). It's deliberately not declared here:
+    # SQLite can't evaluate to_tsvector, and create_all runs against SQLite
+    # in tests. Queries reference it via literal_column behind a dialect
+    # guard.
     
     # Dates
     posting_date = Column(DateTime)
@@ -53,10 +63,33 @@ class Job(Base):
     # Indexes for performance
     __table_args__ = (
         Index('idx_job_search', 'title', 'department', 'location'),
-        Index('idx_job_deadline', 'deadline_date', 'is_active'),
-        Index('idx_job_created', 'created_at', 'is_active'),
+        # Equality column leads, range column follows; the INCLUDE columns
+        # make it covering for listing queries on PostgreSQL (ignored on
+        # other dialects)
+        Index('idx_job_deadline', 'is_active', 'deadline_date',
+              postgresql_include=('title', 'department', 'location', 'application_link')),
+        Index('idx_job_created', 'is_active', 'created_at'),
+        Index('idx_job_active_dept', 'is_active', 'department'),
+        # Matches the hot listing predicate: active + upcoming deadline,
+        # ordered by newest first
+        Index('idx_job_active_deadline_created', 'is_active', 'deadline_date', 'created_at'),
+        # Containment lookups on the skills array (PostgreSQL only)
+        Index('idx_job_skills_gin', 'skills', postgresql_using='gin'),
     )
 
+    @classmethod
+    def bulk_insert(cls, session, rows):
+        """Insert many cleaned job dicts in one executemany statement.
+
+        Skips the per-object identity-map and unit-of-work bookkeeping that
+        session.add(Job(...)) pays for each row; dict keys must match column
+        names (clean_batch output already does).
+        """
+        if not rows:
+            return
+        session.execute(cls.__table__.insert(), rows)
+        session.commit()
+
 class User(Base):
     __tablename__ = "users"
     
@@ -95,6 +128,9 @@ class Alert(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     last_sent = Column(DateTime)
-    
+
     # Relationships
-    user = relationship("User", back_populates="alerts")
\ No newline at end of file
+    user = relationship("User", back_populates="alerts")
+
+    # The alert sweep only ever reads active alerts
+    __table_args__ = (Index('idx_alert_active', 'is_active'),)
\ No newline at end of file
@@ -3,163 +3,285 @@
 # =============================================================================
 
 import re
+import functools
+from bisect import bisect_right
 from typing import List, Optional, Dict, Tuple
 from datetime import datetime
 import logging
 
+# Optional: single-pass multi-substring matching for location lookup
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: RE2 executes the fused alternations as a linear-time DFA, which
+# both speeds them up and removes backtracking blowup on adversarial
+# scraped input. Falls back to the stdlib engine when the binding is absent.
+try:
+    import re2 as re_fast
+except ImportError:
+    re_fast = re
+
 logger = logging.getLogger(__name__)
 
+# Small utility patterns compiled once at import. The vacancy fallback only
+# accepts counts up to 1000, so capping the match at four digits keeps long
+# identifiers (years, reference numbers) out of the candidate list.
+_SMALL_NUMBER_RE = re.compile(r'\b(\d{1,4})\b')
+_LOCATION_CLEAN_RE = re.compile(r"[^\w\s']")
+# Tokenizer for skill lookup; keeps c++, c# and node.js intact
+_TOKEN_RE = re.compile(r'[a-z0-9.+#]+')
+
+# Literal hints that must appear for the corresponding patterns to match at
+# all. A str.__contains__ scan is far cheaper than a regex alternation, and
+# most descriptions carry none of these fields, so the common case returns
+# None without touching the regex engine.
+_SALARY_HINTS = ('taka', 'tk', 'bdt', 'salary', 'grade', 'pay')
+_EXPERIENCE_HINTS = ('experience', 'fresh', 'entry')
+_GRADE_HINTS = ('grade', 'pay', 'class', 'category')
+_VACANCY_HINTS = ('post', 'position', 'vacanc', 'opening', 'জন', 'person')
+
+# Month-name lookup shared with JobParser's date parsing
+_MONTH_NAMES = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12
+}
+
+# Location mapping for Bangladesh, shared with JobParser
+_LOCATION_MAPPING = {
+    'dhaka': 'Dhaka',
+    'chittagong': 'Chittagong',
+    'chattogram': 'Chittagong',
+    'sylhet': 'Sylhet',
+    'rajshahi': 'Rajshahi',
+    'khulna': 'Khulna',
+    'barisal': 'Barisal',
+    'barishal': 'Barisal',
+    'rangpur': 'Rangpur',
+    'mymensingh': 'Mymensingh',
+    'comilla': 'Comilla',
+    'cox\'s bazar': 'Cox\'s Bazar',
+    'jessore': 'Jessore',
+    'bogra': 'Bogra',
+    'faridpur': 'Faridpur',
+    'pabna': 'Pabna'
+}
+
+def _build_location_automaton():
+    """One automaton finds any known city in a single pass over the text
+    instead of one substring scan per mapping key. None when pyahocorasick
+    is not installed; callers fall back to the scan loop."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for key, value in _LOCATION_MAPPING.items():
+        automaton.add_word(key, value)
+    automaton.make_automaton()
+    return automaton
+
+_LOC_AUTOMATON = _build_location_automaton()
+
+@functools.lru_cache(maxsize=2048)
+def _normalize_location_cached(location_clean: str) -> str:
+    """Map a cleaned, lowercased location string to its canonical city.
+
+    Locations repeat massively across postings ("dhaka" alone covers a
+    large share), so the lookup is memoized on the cleaned string."""
+    if _LOC_AUTOMATON is not None:
+        for _, value in _LOC_AUTOMATON.iter(location_clean):
+            return value
+    else:
+        for key, value in _LOCATION_MAPPING.items():
+            if key in location_clean:
+                return value
+
+    # Default formatting
+    return ' '.join(word.capitalize() for word in location_clean.split())
+
 class FieldExtractor:
     def __init__(self):
-        # Skill patterns for extraction
-        self.skill_patterns = {
-            'programming': [
-                r'\b(python|java|javascript|php|c\+\+|c#|sql|html|css|react|angular|vue|node\.?js)\b',
-                r'\b(django|flask|spring|laravel|bootstrap|jquery)\b',
-                r'\b(mysql|postgresql|mongodb|oracle|sqlite)\b'
-            ],
-            'office': [
-                r'\b(microsoft\s+office|ms\s+office|excel|word|powerpoint|outlook)\b',
-                r'\b(google\s+workspace|google\s+docs|sheets|slides)\b',
-                r'\b(pdf|spreadsheet|presentation)\b'
-            ],
-            'technical': [
-                r'\b(autocad|solidworks|matlab|photoshop|illustrator)\b',
-                r'\b(linux|windows|unix|ubuntu|centos)\b',
-                r'\b(git|github|gitlab|svn|version\s+control)\b'
-            ],
-            'soft_skills': [
-                r'\b(communication|leadership|teamwork|problem\s+solving|analytical)\b',
-                r'\b(project\s+management|time\s+management|critical\s+thinking)\b',
-                r'\b(presentation|negotiation|interpersonal|organizational)\b'
-            ]
-        }
-        
-        # Education patterns
-        self.education_patterns = [
-            r'\b(bachelor|masters?|phd|doctorate|diploma|certificate)\b',
-            r'\b(b\.?sc|m\.?sc|ba|ma|bba|mba|llb|mbbs|phd)\b',
-            r'\b(engineering|medicine|arts|science|commerce|law|business)\b',
-            r'\b(computer\s+science|civil\s+engineering|electrical\s+engineering)\b',
-            r'\b(mechanical\s+engineering|software\s+engineering)\b',
-            r'\b(university|college|institute|polytechnic)\b'
-        ]
-        
-        # Experience patterns
-        self.experience_patterns = [
+        # All patterns are compiled once here. Passing raw strings to
+        # re.search/re.findall on every call pays a cache lookup keyed on
+        # the pattern string each time, and the cache is capped — compiled
+        # objects skip that entirely on the per-job hot path.
+
+        # Single-word skills are matched by tokenizing the text once and
+        # intersecting hashed sets — O(len(text)) tokenization plus O(k)
+        # lookups instead of one alternation branch per skill
+        self._single_word_skills = frozenset((
+            # programming
+            'python', 'java', 'javascript', 'php', 'c++', 'c#', 'sql',
+            'html', 'css', 'react', 'angular', 'vue', 'nodejs', 'node.js',
+            'django', 'flask', 'spring', 'laravel', 'bootstrap', 'jquery',
+            'mysql', 'postgresql', 'mongodb', 'oracle', 'sqlite',
+            # office
+            'excel', 'word', 'powerpoint', 'outlook', 'sheets', 'slides',
+            'pdf', 'spreadsheet', 'presentation',
+            # technical
+            'autocad', 'solidworks', 'matlab', 'photoshop', 'illustrator',
+            'linux', 'windows', 'unix', 'ubuntu', 'centos',
+            'git', 'github', 'gitlab', 'svn',
+            # soft skills
+            'communication', 'leadership', 'teamwork', 'analytical',
+            'negotiation', 'interpersonal', 'organizational',
+            # keyword list formerly checked with substring scans
+            'typing', 'internet', 'email', 'database', 'networking',
+            'troubleshooting', 'documentation', 'reporting', 'analysis',
+            'research', 'planning', 'coordination', 'supervision',
+        ))
+
+        # Multi-word skills keep a (much smaller) fused alternation
+        # Inline (?i) rather than the IGNORECASE flag: google-re2's compile
+        # doesn't take stdlib flag objects
+        self._multi_word_skills_re = re_fast.compile(
+            r'(?i)\b(microsoft\s+office|ms\s+office|google\s+workspace'
+            r'|google\s+docs|version\s+control|problem\s+solving'
+            r'|project\s+management|time\s+management|critical\s+thinking)\b'
+        )
+
+        # Education alternatives, likewise one fused scan
+        education_alternatives = (
+            r'computer\s+science', r'civil\s+engineering',
+            r'electrical\s+engineering', r'mechanical\s+engineering',
+            r'software\s+engineering',
+            'bachelor', 'masters?', 'phd', 'doctorate', 'diploma',
+            'certificate', r'b\.?sc', r'm\.?sc', 'ba', 'ma', 'bba', 'mba',
+            'llb', 'mbbs', 'engineering', 'medicine', 'arts', 'science',
+            'commerce', 'law', 'business', 'university', 'college',
+            'institute', 'polytechnic',
+        )
+        self._edu_re = re_fast.compile(
+            r'(?i)\b(' + '|'.join(education_alternatives) + r')\b'
+        )
+
+        # Experience patterns (searched against lowercased text)
+        self.experience_patterns = [re.compile(p) for p in (
             r'(\d+)[\+\-\s]*(?:to|-)?\s*(\d+)?\s*years?\s+(?:of\s+)?experience',
             r'minimum\s+(\d+)\s+years?\s+experience',
             r'at\s+least\s+(\d+)\s+years?\s+experience',
             r'(\d+)\s*\+\s*years?\s+experience',
-            r'fresh\s+graduate|fresher|entry\s+level|no\s+experience'
-        ]
-        
+        )]
+        self._fresh_re = re.compile(r'fresh\s+graduate|fresher|entry\s+level|no\s+experience')
+
         # Salary patterns
-        self.salary_patterns = [
+        self.salary_patterns = [re.compile(p) for p in (
             r'(\d{1,3}(?:,\d{3})*)\s*(?:to|-)?\s*(\d{1,3}(?:,\d{3})*)?\s*(?:taka|tk|bdt)',
             r'grade\s*(\d+)',
             r'pay\s+scale[:\s]+(\d+(?:,\d+)*)\s*-\s*(\d+(?:,\d+)*)',
             r'salary[:\s]+(\d+(?:,\d+)*)\s*(?:to|-)?\s*(\d+(?:,\d+)*)?'
-        ]
-        
+        )]
+
         # Age patterns
-        self.age_patterns = [
+        self.age_patterns = [re.compile(p) for p in (
             r'age\s+limit[:\s]+(\d+)\s*(?:to|-)?\s*(\d+)?\s*years?',
             r'(\d+)\s*(?:to|-)?\s*(\d+)?\s*years?\s+(?:of\s+)?age',
             r'maximum\s+age[:\s]+(\d+)\s*years?',
             r'minimum\s+age[:\s]+(\d+)\s*years?'
+        )]
+
+        # Vacancy forms fused into one pattern (Bengali and English); the
+        # count lands in whichever group matched. Deliberately stdlib re,
+        # not re_fast: RE2's \d is ASCII-only, but "১৫ জন" is the canonical
+        # Bengali phrasing and stdlib \d matches Bengali numerals (which
+        # int() then converts)
+        self._vacancy_re = re.compile(
+            r'(\d+)\s*(?:posts?|positions?|vacancies|openings?|জন|persons?)'
+            r'|vacancies?[:\s]+(\d+)'
+            r'|posts?[:\s]+(\d+)'
+        )
+
+        # Grade/scale patterns
+        self.grade_patterns = [re.compile(p) for p in (
+            r'grade[:\s]+(\d+)',
+            r'pay\s+scale[:\s]+(\d+)',
+            r'class[:\s]+([ivxl]+)',
+            r'category[:\s]+([abc])'
+        )]
+
+        # Each deadline pattern carries its own parser, so the extraction
+        # loop dispatches straight to the matching one instead of comparing
+        # tags per iteration
+        _month = ('january|february|march|april|may|june|july|august'
+                  '|september|october|november|december')
+
+        def _parse_dmy(groups):  # DD-MM-YYYY or DD/MM/YYYY
+            return datetime(int(groups[2]), int(groups[1]), int(groups[0]))
+
+        def _parse_ymd(groups):  # YYYY-MM-DD or YYYY/MM/DD
+            return datetime(int(groups[0]), int(groups[1]), int(groups[2]))
+
+        def _parse_day_month_year(groups):  # DD Month YYYY
+            return datetime(int(groups[2]),
+                            self._month_name_to_number(groups[1]),
+                            int(groups[0]))
+
+        def _parse_month_day_year(groups):  # Month DD, YYYY
+            return datetime(int(groups[2]),
+                            self._month_name_to_number(groups[0]),
+                            int(groups[1]))
+
+        self.date_patterns = [
+            (re_fast.compile(r'(\d{1,2})[-/](\d{1,2})[-/](\d{4})'), _parse_dmy),
+            (re_fast.compile(r'(\d{4})[-/](\d{1,2})[-/](\d{1,2})'), _parse_ymd),
+            (re_fast.compile(r'(\d{1,2})\s+(' + _month + r')\s+(\d{4})'), _parse_day_month_year),
+            (re_fast.compile(r'(' + _month + r')\s+(\d{1,2}),?\s+(\d{4})'), _parse_month_day_year),
         ]
-        
+
         # Location mapping for Bangladesh
-        self.location_mapping = {
-            'dhaka': 'Dhaka',
-            'chittagong': 'Chittagong', 
-            'chattogram': 'Chittagong',
-            'sylhet': 'Sylhet',
-            'rajshahi': 'Rajshahi',
-            'khulna': 'Khulna',
-            'barisal': 'Barisal',
-            'barishal': 'Barisal',
-            'rangpur': 'Rangpur',
-            'mymensingh': 'Mymensingh',
-            'comilla': 'Comilla',
-            'cox\'s bazar': 'Cox\'s Bazar',
-            'jessore': 'Jessore',
-            'bogra': 'Bogra',
-            'faridpur': 'Faridpur',
-            'pabna': 'Pabna'
-        }
+        self.location_mapping = _LOCATION_MAPPING
+
+        # Memoize the full extraction per description (bound per instance
+        # so the cache key doesn't include self)
+        self._extract_all = functools.lru_cache(maxsize=4096)(self._extract_all)
     
     def extract_skills(self, text: str) -> List[str]:
         """Extract skills from job description using pattern matching"""
         if not text:
             return []
-        
-        skills = set()
-        text_lower = text.lower()
-        
-        # Extract using patterns
-        for category, patterns in self.skill_patterns.items():
-            for pattern in patterns:
-                matches = re.findall(pattern, text_lower, re.IGNORECASE)
-                if isinstance(matches[0], tuple) if matches else False:
-                    skills.update([m for match in matches for m in match if m])
-                else:
-                    skills.update(matches)
-        
-        # Additional keyword-based extraction
-        skill_keywords = [
-            'typing', 'internet', 'email', 'database', 'networking',
-            'troubleshooting', 'documentation', 'reporting', 'analysis',
-            'research', 'planning', 'coordination', 'supervision'
-        ]
-        
-        for keyword in skill_keywords:
-            if keyword in text_lower:
-                skills.add(keyword)
-        
-        # Clean and format skills
-        cleaned_skills = []
-        for skill in skills:
-            skill = skill.strip().lower()
-            if len(skill) > 2:  # Minimum length check
-                cleaned_skills.append(skill.title())
-        
-        return list(set(cleaned_skills))  # Remove duplicates
+        return self._extract_skills_lower(text.lower())
+
+    def _extract_skills_lower(self, text_lower: str) -> List[str]:
+        # Tokenize once and intersect with the known single-word skills,
+        # then one small alternation pass for the multi-word ones
+        # (sentence-final dots stick to the token, so strip them)
+        tokens = frozenset(t.rstrip('.') for t in _TOKEN_RE.findall(text_lower))
+        skills = self._single_word_skills & tokens
+        skills |= set(self._multi_word_skills_re.findall(text_lower))
+
+        # Format in one pass: matches are already lowercase, so title-case
+        # and length-filter directly into the result
+        return [s.title() for s in skills if len(s) > 2]
     
     def extract_education(self, text: str) -> Optional[str]:
         """Extract education requirements"""
         if not text:
             return None
-        
-        education_info = []
-        text_lower = text.lower()
-        
-        for pattern in self.education_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            education_info.extend(matches)
-        
-        if education_info:
-            # Clean and deduplicate
-            unique_education = list(set([edu.title() for edu in education_info]))
-            return ', '.join(unique_education)
-        
-        return None
+        return self._extract_education_lower(text.lower())
+
+    def _extract_education_lower(self, text_lower: str) -> Optional[str]:
+        # Dedup and format in a single comprehension
+        unique_education = {edu.title() for edu in self._edu_re.findall(text_lower)}
+        return ', '.join(unique_education) if unique_education else None
     
     def extract_experience(self, text: str) -> Optional[str]:
         """Extract experience requirements"""
         if not text:
             return None
-        
-        text_lower = text.lower()
-        
+        return self._extract_experience_lower(text.lower())
+
+    def _extract_experience_lower(self, text_lower: str) -> Optional[str]:
+        if not any(hint in text_lower for hint in _EXPERIENCE_HINTS):
+            return None
+
         # Check for fresh graduate first
-        if re.search(r'fresh\s+graduate|fresher|entry\s+level|no\s+experience', text_lower):
+        if self._fresh_re.search(text_lower):
             return "Fresh Graduate"
-        
+
         # Extract years of experience
         for pattern in self.experience_patterns:
-            match = re.search(pattern, text_lower)
+            match = pattern.search(text_lower)
             if match:
                 groups = match.groups()
                 if len(groups) >= 2 and groups[1]:
@@ -173,11 +295,14 @@ class FieldExtractor:
         """Extract salary information"""
         if not text:
             return None
-        
-        text_lower = text.lower()
-        
+        return self._extract_salary_info_lower(text.lower())
+
+    def _extract_salary_info_lower(self, text_lower: str) -> Optional[str]:
+        if not any(hint in text_lower for hint in _SALARY_HINTS):
+            return None
+
         for pattern in self.salary_patterns:
-            match = re.search(pattern, text_lower)
+            match = pattern.search(text_lower)
             if match:
                 return match.group(0).strip()
         
@@ -187,11 +312,15 @@ class FieldExtractor:
         """Extract age range"""
         if not text:
             return None, None
-        
-        text_lower = text.lower()
-        
+        return self._extract_age_range_lower(text.lower())
+
+    def _extract_age_range_lower(self, text_lower: str) -> Tuple[Optional[int], Optional[int]]:
+        # Every age pattern contains the literal "age"
+        if 'age' not in text_lower:
+            return None, None
+
         for pattern in self.age_patterns:
-            match = re.search(pattern, text_lower)
+            match = pattern.search(text_lower)
             if match:
                 groups = match.groups()
                 if len(groups) >= 2 and groups[1]:
@@ -210,32 +339,24 @@ class FieldExtractor:
         """Extract number of vacancies"""
         if not text:
             return None
+        return self._extract_vacancies_lower(text.lower())
+
+    def _extract_vacancies_lower(self, text_lower: str) -> Optional[int]:
+        if not any(hint in text_lower for hint in _VACANCY_HINTS):
+            return None
+
+        match = self._vacancy_re.search(text_lower)
+        if match:
+            return int(next(g for g in match.groups() if g))
         
-        # Patterns for vacancy extraction
-        patterns = [
-            r'(\d+)\s*(?:posts?|positions?|vacancies|openings?)',
-            r'vacancies?[:\s]+(\d+)',
-            r'posts?[:\s]+(\d+)',
-            r'(\d+)\s*(?:জন|persons?)'  # Bengali and English
-        ]
-        
-        text_lower = text.lower()
-        
-        for pattern in patterns:
-            match = re.search(pattern, text_lower)
-            if match:
-                return int(match.group(1))
-        
-        # Fallback: extract any number if context suggests vacancies
+        # Fallback: first reasonable number when context suggests vacancies
         if 'vacancy' in text_lower or 'post' in text_lower:
-            numbers = re.findall(r'\b(\d+)\b', text_lower)
-            if numbers:
-                # Take the first reasonable number (not too large)
-                for num in numbers:
-                    val = int(num)
-                    if 1 <= val <= 1000:  # Reasonable range for job vacancies
-                        return val
-        
+            return next(
+                (int(n) for n in _SMALL_NUMBER_RE.findall(text_lower)
+                 if 1 <= int(n) <= 1000),
+                None,
+            )
+
         return None
     
     def normalize_location(self, location: str) -> str:
@@ -243,32 +364,21 @@ class FieldExtractor:
         if not location:
             return ""
         
-        location_clean = re.sub(r'[^\w\s\']', '', location.lower().strip())
-        
-        # Check mapping
-        for key, value in self.location_mapping.items():
-            if key in location_clean:
-                return value
-        
-        # Default formatting
-        return ' '.join(word.capitalize() for word in location_clean.split())
+        location_clean = _LOCATION_CLEAN_RE.sub('', location.lower().strip())
+        return _normalize_location_cached(location_clean)
     
     def extract_grade_scale(self, text: str) -> Optional[str]:
         """Extract government job grade/scale"""
         if not text:
             return None
-        
-        patterns = [
-            r'grade[:\s]+(\d+)',
-            r'pay\s+scale[:\s]+(\d+)',
-            r'class[:\s]+([ivxl]+)',
-            r'category[:\s]+([abc])'
-        ]
-        
-        text_lower = text.lower()
-        
-        for pattern in patterns:
-            match = re.search(pattern, text_lower)
+        return self._extract_grade_scale_lower(text.lower())
+
+    def _extract_grade_scale_lower(self, text_lower: str) -> Optional[str]:
+        if not any(hint in text_lower for hint in _GRADE_HINTS):
+            return None
+
+        for pattern in self.grade_patterns:
+            match = pattern.search(text_lower)
             if match:
                 return match.group(0).title()
         
@@ -278,58 +388,31 @@ class FieldExtractor:
         """Extract application deadline"""
         if not text:
             return None
-        
-        # Date patterns
-        date_patterns = [
-            r'(\d{1,2})[-/](\d{1,2})[-/](\d{4})',  # DD-MM-YYYY or DD/MM/YYYY
-            r'(\d{4})[-/](\d{1,2})[-/](\d{1,2})',  # YYYY-MM-DD or YYYY/MM/DD
-            r'(\d{1,2})\s+(january|february|march|april|may|june|july|august|september|october|november|december)\s+(\d{4})',
-            r'(january|february|march|april|may|june|july|august|september|october|november|december)\s+(\d{1,2}),?\s+(\d{4})'
-        ]
-        
-        text_lower = text.lower()
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text_lower)
+        return self._extract_application_deadline_lower(text.lower())
+
+    def _extract_application_deadline_lower(self, text_lower: str) -> Optional[datetime]:
+        for pattern, parse in self.date_patterns:
+            match = pattern.search(text_lower)
             if match:
                 try:
-                    groups = match.groups()
-                    
-                    if pattern == date_patterns[0]:  # DD-MM-YYYY
-                        day, month, year = int(groups[0]), int(groups[1]), int(groups[2])
-                        return datetime(year, month, day)
-                    elif pattern == date_patterns[1]:  # YYYY-MM-DD
-                        year, month, day = int(groups[0]), int(groups[1]), int(groups[2])
-                        return datetime(year, month, day)
-                    elif pattern == date_patterns[2]:  # DD Month YYYY
-                        day, month_name, year = int(groups[0]), groups[1], int(groups[2])
-                        month = self._month_name_to_number(month_name)
-                        return datetime(year, month, day)
-                    elif pattern == date_patterns[3]:  # Month DD, YYYY
-                        month_name, day, year = groups[0], int(groups[1]), int(groups[2])
-                        month = self._month_name_to_number(month_name)
-                        return datetime(year, month, day)
+                    return parse(match.groups())
                 except (ValueError, TypeError):
                     continue
-        
+
         return None
     
     def _month_name_to_number(self, month_name: str) -> int:
-        """Convert month name to number"""
-        months = {
-            'january': 1, 'february': 2, 'march': 3, 'april': 4,
-            'may': 5, 'june': 6, 'july': 7, 'august': 8,
-            'september': 9, 'october': 10, 'november': 11, 'december': 12
-        }
-        return months.get(month_name.lower(), 1)
+        """Convert month name to number (callers pass lowercased names)"""
+        return _MONTH_NAMES.get(month_name, 1)
     
     def extract_department_clean(self, department: str) -> str:
         """Clean and normalize department names"""
         if not department:
             return ""
         
-        # Remove extra text and normalize
-        department = re.sub(r'\s+', ' ', department.strip())
+        # Remove extra text and normalize (split/join collapses whitespace
+        # without the regex engine)
+        department = ' '.join(department.split())
         
         # Common department mappings
         dept_mappings = {
@@ -352,15 +435,88 @@ class FieldExtractor:
         """Extract all information from a job description"""
         if not text:
             return {}
-        
+
+        # Delegate to the memoized extractor, but hand the caller a fresh
+        # dict and list so mutations can't poison the cached entry
+        info = self._extract_all(text)
+        result = dict(info)
+        result['skills'] = list(result['skills'])
+        return result
+
+    def _extract_all(self, text: str) -> Dict:
+        """Run every extractor once; memoized per description in __init__.
+
+        Pagination, retries and re-scrapes feed the same descriptions back
+        through the pipeline, so repeat calls skip all the regex work."""
+        # Lowercase once; every extractor works on the same string instead
+        # of each allocating its own lowered copy
+        text_lower = text.lower()
+        age_min, age_max = self._extract_age_range_lower(text_lower)
         return {
-            'skills': self.extract_skills(text),
-            'education': self.extract_education(text),
-            'experience': self.extract_experience(text),
-            'salary': self.extract_salary_info(text),
-            'age_min': self.extract_age_range(text)[0],
-            'age_max': self.extract_age_range(text)[1],
-            'vacancies': self.extract_vacancies(text),
-            'grade': self.extract_grade_scale(text),
-            'deadline': self.extract_application_deadline(text)
-        }
\ No newline at end of file
+            'skills': tuple(self._extract_skills_lower(text_lower)),
+            'education': self._extract_education_lower(text_lower),
+            'experience': self._extract_experience_lower(text_lower),
+            'salary': self._extract_salary_info_lower(text_lower),
+            'age_min': age_min,
+            'age_max': age_max,
+            'vacancies': self._extract_vacancies_lower(text_lower),
+            'grade': self._extract_grade_scale_lower(text_lower),
+            'deadline': self._extract_application_deadline_lower(text_lower)
+        }
+
+    def extract_batch(self, texts: List[str]) -> List[Dict]:
+        """Extract comprehensive info for a whole batch of descriptions.
+
+        The findall-style extractors (tokens, multi-word skills, education)
+        run once over the batch joined with a sentinel that can't occur in
+        a match, and each hit is mapped back to its job by bisecting the
+        segment offsets — amortizing the regex engine setup across the
+        batch instead of paying it per job. The first-match extractors
+        still run per job but reuse the already-lowered segments.
+        """
+        if not texts:
+            return []
+
+        lowered = [t.lower() if t else '' for t in texts]
+        sep = '\x1f\x1e\x1f'
+        joined = sep.join(lowered)
+        offsets = []
+        pos = 0
+        for segment in lowered:
+            offsets.append(pos)
+            pos += len(segment) + len(sep)
+
+        token_sets = [set() for _ in texts]
+        for match in _TOKEN_RE.finditer(joined):
+            token_sets[bisect_right(offsets, match.start()) - 1].add(
+                match.group().rstrip('.'))
+
+        multi_word_sets = [set() for _ in texts]
+        for match in self._multi_word_skills_re.finditer(joined):
+            multi_word_sets[bisect_right(offsets, match.start()) - 1].add(
+                match.group(1))
+
+        education_sets = [set() for _ in texts]
+        for match in self._edu_re.finditer(joined):
+            education_sets[bisect_right(offsets, match.start()) - 1].add(
+                match.group(1).title())
+
+        results = []
+        for i, text_lower in enumerate(lowered):
+            if not text_lower:
+                results.append({})
+                continue
+            skills = (self._single_word_skills & token_sets[i]) | multi_word_sets[i]
+            age_min, age_max = self._extract_age_range_lower(text_lower)
+            results.append({
+                'skills': [s.title() for s in skills if len(s) > 2],
+                'education': ', '.join(education_sets[i]) if education_sets[i] else None,
+                'experience': self._extract_experience_lower(text_lower),
+                'salary': self._extract_salary_info_lower(text_lower),
+                'age_min': age_min,
+                'age_max': age_max,
+                'vacancies': self._extract_vacancies_lower(text_lower),
+                'grade': self._extract_grade_scale_lower(text_lower),
+                'deadline': self._extract_application_deadline_lower(text_lower)
+            })
+        return results
\ No newline at end of file
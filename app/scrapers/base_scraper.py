@@ -4,23 +4,42 @@
 
 import asyncio
 from abc import ABC, abstractmethod
-from playwright.async_api import async_playwright, Browser, Page
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 import aiohttp
 from typing import Dict, List, Optional
 import random
 import logging
 
-from app.parsers.job_parser import JobParser
+from app.parsers.job_parser import default_parser
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Allocated once; random.choice on a tuple skips the per-call list build
+_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
+)
+
+class NonRetryableScrapeError(Exception):
+    """Raised for failures retrying can't fix (e.g. HTTP 4xx other than 429),
+    so scrape_with_retry gives up immediately instead of burning its budget."""
+
 class BaseScraper(ABC):
     def __init__(self, name: str):
         self.name = name
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.session: Optional[aiohttp.ClientSession] = None
-        self.parser = JobParser()
+        # Stateless after construction; the shared instance avoids
+        # recompiling the pattern tables per scraper
+        self.parser = default_parser
+        # Per-run memo of scraped URLs: overlapping link paths and manager
+        # retries otherwise re-fetch the same page, and the per-URL lock
+        # collapses concurrent duplicates into a single in-flight request
+        self._url_cache: Dict[str, Dict] = {}
+        self._url_locks: Dict[str, asyncio.Lock] = {}
         
     async def __aenter__(self):
         await self._setup()
@@ -38,13 +57,24 @@ class BaseScraper(ABC):
         try:
             self.playwright = await async_playwright().start()
             self.browser = await self.playwright.chromium.launch(headless=True)
+            # One shared context for the whole scrape: pages derived from it
+            # reuse cookies, the TLS/HTTP2 sockets and the cache, where
+            # browser.new_page() spins up a cold context per URL
+            self.context = await self.browser.new_context(
+                user_agent=self._get_random_user_agent()
+            )
         except Exception as e:
             logger.warning(f"Playwright/browser startup failed, falling back to HTTP session: {e}")
             self.playwright = None
             self.browser = None
+            self.context = None
 
-        # Always create an aiohttp session for HTTP based fallback scraping
+        # Always create an aiohttp session for HTTP based fallback scraping.
+        # A wide keep-alive pool (vs the default 100-total/no-per-host
+        # tuning) lets the detail-page fan-out reuse warm connections to the
+        # same host instead of paying a TCP+TLS handshake per URL
         self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=300),
             timeout=aiohttp.ClientTimeout(total=settings.SCRAPER_TIMEOUT),
             headers={'User-Agent': self._get_random_user_agent()}
         )
@@ -53,6 +83,8 @@ class BaseScraper(ABC):
         """Cleanup resources"""
         if self.session:
             await self.session.close()
+        if self.context:
+            await self.context.close()
         if self.browser:
             await self.browser.close()
         if hasattr(self, 'playwright'):
@@ -60,12 +92,7 @@ class BaseScraper(ABC):
     
     def _get_random_user_agent(self) -> str:
         """Get random user agent"""
-        user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
-        ]
-        return random.choice(user_agents)
+        return random.choice(_USER_AGENTS)
     
     async def _delay(self):
         """Random delay between requests"""
@@ -77,21 +104,38 @@ class BaseScraper(ABC):
         pass
     
     async def scrape_with_retry(self, url: str, retries: int = None) -> Optional[Dict]:
-        """Scrape with retry logic"""
+        """Scrape with retry logic, memoized per URL for the run"""
         if retries is None:
             retries = settings.SCRAPER_RETRIES
-        
-        for attempt in range(retries):
-            try:
-                await self._delay()
-                return await self._scrape_url(url)
-            except Exception as e:
-                logger.warning(f"Scrape attempt {attempt + 1} failed for {url}: {e}")
-                if attempt == retries - 1:
-                    logger.error(f"Failed to scrape {url} after {retries} attempts")
+
+        if url in self._url_cache:
+            return self._url_cache[url]
+
+        lock = self._url_locks.setdefault(url, asyncio.Lock())
+        async with lock:
+            # A concurrent caller may have fetched it while we waited
+            if url in self._url_cache:
+                return self._url_cache[url]
+
+            for attempt in range(retries):
+                try:
+                    await self._delay()
+                    data = await self._scrape_url(url)
+                    self._url_cache[url] = data
+                    return data
+                except NonRetryableScrapeError as e:
+                    logger.error(f"Non-retryable failure for {url}: {e}")
                     return None
-                await asyncio.sleep(2 ** attempt)  # Exponential backoff
-        
+                except Exception as e:
+                    logger.warning(f"Scrape attempt {attempt + 1} failed for {url}: {e}")
+                    if attempt == retries - 1:
+                        logger.error(f"Failed to scrape {url} after {retries} attempts")
+                        return None
+                    # Jittered, capped backoff: full 2**attempt sleeps pin the
+                    # worker's browser/session for the whole schedule, and
+                    # unjittered retries from parallel workers re-land together
+                    await asyncio.sleep(min(30, (2 ** attempt) * (0.5 + random.random())))
+
         return None
     
     @abstractmethod
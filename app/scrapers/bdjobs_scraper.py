@@ -29,8 +29,12 @@ class BDJobsScraper(BaseScraper):
 		try:
 			# Prefer Playwright when available
 			if self.browser:
-				page = await self.browser.new_page()
-				response = await page.goto(self.jobs_url, wait_until="networkidle")
+				page = await self.context.new_page()
+				page.set_default_navigation_timeout(15_000)
+				# domcontentloaded fires once the DOM is parsed; networkidle
+				# waits for analytics/ad requests to go quiet, which on job
+				# portals adds seconds per navigation for nothing we scrape
+				response = await page.goto(self.jobs_url, wait_until="domcontentloaded")
 
 				# If the page returned a non-200 status (404, 500, etc.), bail out
 				if response is None or getattr(response, 'status', lambda: None)() != 200:
@@ -49,7 +53,7 @@ class BDJobsScraper(BaseScraper):
 							logger.warning(f"BDJobs listing endpoint returned {resp.status}")
 							return jobs
 						# Placeholder: do not parse HTML yet
-						body = await resp.text()
+						body = await resp.read()
 						# In a full implementation we'd parse `body` to extract job links
 				except Exception as e:
 					logger.error(f"HTTP fallback failed: {e}")
@@ -61,9 +65,10 @@ class BDJobsScraper(BaseScraper):
 	async def _scrape_url(self, url: str) -> Dict:
 		# If Playwright is available, use it. Otherwise fall back to HTTP GET.
 		if self.browser:
-			page: Page = await self.browser.new_page()
+			page: Page = await self.context.new_page()
+			page.set_default_navigation_timeout(15_000)
 			try:
-				response = await page.goto(url, wait_until="networkidle")
+				response = await page.goto(url, wait_until="domcontentloaded")
 				if response is None or getattr(response, 'status', lambda: None)() != 200:
 					logger.warning(f"Job detail URL returned non-200 status: {getattr(response, 'status', lambda: None)()}")
 					return {}
@@ -77,7 +82,7 @@ class BDJobsScraper(BaseScraper):
 					if resp.status != 200:
 						logger.warning(f"Job detail endpoint returned {resp.status}")
 						return {}
-					_ = await resp.text()
+					_ = await resp.read()
 					return {}
 			except Exception as e:
 				logger.error(f"HTTP fallback job detail failed: {e}")
@@ -2,58 +2,159 @@
 # 7. Government Jobs Scraper (app/scrapers/govbd_scraper.py)
 # =============================================================================
 
+import asyncio
+import hashlib
+import re
+from bisect import bisect_right
 from typing import List, Dict, Optional
 from datetime import datetime
 from playwright.async_api import Page
 import logging
-from bs4 import BeautifulSoup
+import lxml.html as lh
+from lxml.cssselect import CSSSelector
+from lxml.etree import XPath
 
-from .base_scraper import BaseScraper
+from app.cache.redis_cache import cache
+from .base_scraper import BaseScraper, NonRetryableScrapeError
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; evaluated in C over the parsed tree instead of a Python
+# loop over every node the way soup.find_all does
+_ANCHOR_XPATH = XPath("//a[@href]")
+
+# One case-insensitive scan per anchor instead of lowercasing href+text
+# into a fresh string and substring-checking it three times
+_JOB_RE = re.compile(r"job|vacancy|circular", re.IGNORECASE)
+
+# Detail pages already scraped within this window are skipped outright —
+# a cache membership test costs microseconds against a full page fetch
+_SEEN_TTL = 7 * 24 * 3600
+
+
+def _seen_key(url: str) -> str:
+    # Hashed so arbitrarily long URLs become fixed-size cache keys
+    return "govbd_seen_" + hashlib.blake2b(url.encode(), digest_size=8).hexdigest()
+
+# Detail-page selectors compile once at import; selector parsing is the
+# expensive half of repeated queries across the ~20 detail pages per run
+_SEL_TITLE = CSSSelector("h1, .job-title, .title")
+_SEL_DEPARTMENT = CSSSelector(".department, .organization")
+_SEL_LOCATION = CSSSelector(".location, .workplace")
+_SEL_DESCRIPTION = CSSSelector(".description, .job-description, .details")
+_SEL_DEADLINE = CSSSelector(".deadline, .last-date")
+_SEL_APPLY = CSSSelector('a[href*="apply"], .apply-link')
+
+
+def _first_text(selector: CSSSelector, tree) -> str:
+    nodes = selector(tree)
+    return nodes[0].text_content().strip() if nodes else ''
+
 
 class GovBDScraper(BaseScraper):
     def __init__(self):
         super().__init__("GovBD")
         self.base_url = "https://www.bcsconfidence.online"
         self.jobs_url = "https://www.bcsconfidence.online/job-news"
-    
+        # Detail pages are server-rendered, so a plain GET plus lxml covers
+        # them; a browser page load costs orders of magnitude more. Flipped
+        # to True automatically when a fetched page lacks the expected
+        # selectors (i.e. the site moved to client-side rendering).
+        self.use_browser = False
+        # Set True to re-crawl detail pages even when the seen-URL cache
+        # says they were fetched recently
+        self.force_recrawl = False
+        # Refreshed at the top of each scrape_jobs run; jobs from the same
+        # pass share one posting_date
+        self._run_ts = datetime.now().isoformat()
+
     async def scrape_jobs(self) -> List[Dict]:
         """Scrape jobs from government portal, with an HTTP fallback when Playwright isn't available."""
         jobs = []
-        
+        # One timestamp per run: every job scraped in this pass shares the
+        # same posting_date, so there's no reason to rebuild it per page
+        self._run_ts = datetime.now().isoformat()
+
         try:
             # If browser is available, use the JS-powered approach
             if self.browser:
-                page = await self.browser.new_page()
-                await page.goto(self.jobs_url, wait_until="networkidle")
+                page = await self.context.new_page()
+                page.set_default_navigation_timeout(15_000)
+                # domcontentloaded is enough for querySelectorAll over anchors;
+                # networkidle stalls on long-polling/analytics traffic and adds
+                # seconds per navigation
+                await page.goto(self.jobs_url, wait_until="domcontentloaded")
                 
-                # Extract job links (from client-side rendered pages)
-                job_links = await page.evaluate("""
-                    () => {
-                        const links = [];
-                        document.querySelectorAll('a[href*="job"]').forEach(link => {
-                            if (link.href && link.textContent.trim()) {
-                                links.push({
-                                    url: link.href,
-                                    title: link.textContent.trim()
-                                });
-                            }
-                        });
-                        return links;
-                    }
+                # One CDP round-trip pulls every link plus whatever card
+                # metadata the listing already renders; detail pages are only
+                # visited for jobs whose card is missing required fields
+                job_links = await page.eval_on_selector_all('a[href*="job"]', """
+                    els => els.map(link => {
+                        const card = link.closest('.job-card, .card, article, li, tr');
+                        const pick = sel => {
+                            const el = card ? card.querySelector(sel) : null;
+                            return el ? el.textContent.trim() : '';
+                        };
+                        return {
+                            url: link.href,
+                            title: link.textContent.trim(),
+                            department: pick('.department, .organization'),
+                            location: pick('.location, .workplace'),
+                            description: pick('.description, .job-description, .details'),
+                            deadline_date: pick('.deadline, .last-date')
+                        };
+                    }).filter(job => job.url && job.title)
                 """)
                 
-                for job_link in job_links[:20]:  # Limit for safety
-                    job_data = await self._scrape_job_detail(page, job_link)
-                    if job_data:
-                        jobs.append(job_data)
-
                 await page.close()
 
+                # Detail pages are dominated by navigation latency, so fetch
+                # them concurrently, each task on its own page; the semaphore
+                # keeps the tab count (and load on the source) bounded
+                sem = asyncio.Semaphore(8)
+
+                async def _fetch_detail(job_link: Dict) -> Optional[Dict]:
+                    async with sem:
+                        seen_key = _seen_key(job_link['url'])
+                        if not self.force_recrawl and await cache.exists(seen_key):
+                            return None
+                        # A fully populated listing card already has every
+                        # field the detail page would give us — skip the fetch
+                        if job_link.get('department') and job_link.get('description'):
+                            await cache.set(seen_key, 1, _SEEN_TTL)
+                            return {
+                                **job_link,
+                                'application_link': job_link['url'],
+                                'source_url': job_link['url'],
+                                'source_site': 'gov.bd',
+                                'posting_date': self._run_ts,
+                            }
+                        if not self.use_browser:
+                            job_data = await self._scrape_job_detail_http(job_link)
+                            if job_data is not None:
+                                await cache.set(seen_key, 1, _SEEN_TTL)
+                                return job_data
+                            # Markup missing the expected selectors: the page
+                            # is client-side rendered, so fall back to the
+                            # browser for this and all remaining details
+                            self.use_browser = True
+                        detail_page = await self.context.new_page()
+                        detail_page.set_default_navigation_timeout(15_000)
+                        try:
+                            job_data = await self._scrape_job_detail(detail_page, job_link)
+                        finally:
+                            await detail_page.close()
+                        if job_data:
+                            await cache.set(seen_key, 1, _SEEN_TTL)
+                        return job_data
+
+                results = await asyncio.gather(
+                    *(_fetch_detail(job_link) for job_link in job_links[:20])  # Limit for safety
+                )
+                jobs.extend(job_data for job_data in results if job_data)
+
             else:
-                # HTTP fallback using BeautifulSoup; this is JS-free but works for
+                # HTTP fallback using lxml; this is JS-free but works for
                 # simple server-rendered pages. It returns basic metadata so the
                 # rest of the pipeline can run during development.
                 try:
@@ -61,33 +162,48 @@ class GovBDScraper(BaseScraper):
                         if resp.status != 200:
                             logger.warning(f"GovBD listing endpoint returned {resp.status}")
                             return jobs
-                        body = await resp.text()
+                        body = await resp.read()
                 except Exception as e:
                     logger.error(f"GovBD HTTP listing request failed: {e}")
                     return jobs
 
-                soup = BeautifulSoup(body, "lxml")
-                anchors = soup.find_all("a", href=True)
+                tree = lh.fromstring(body)
                 seen = set()
 
-                for a in anchors:
-                    href = a.get("href")
-                    text = (a.get_text(strip=True) or "").strip()
-                    if not text:
+                entries = []
+                for a in _ANCHOR_XPATH(tree):
+                    text = a.text_content().strip()
+                    if text:
+                        entries.append((a.get("href"), text))
+
+                # One regex pass over all anchors at once: each match is
+                # credited back to its anchor through the offset table, so
+                # the engine runs once instead of twice per anchor
+                offsets = [0]
+                pos = 0
+                for href, text in entries:
+                    pos += len(href) + 1 + len(text) + 1
+                    offsets.append(pos)
+                corpus = '\x00'.join(f"{href}\x00{text}" for href, text in entries)
+
+                matched = {
+                    bisect_right(offsets, match.start()) - 1
+                    for match in _JOB_RE.finditer(corpus)
+                }
+
+                for i in sorted(matched):
+                    href, text = entries[i]
+                    full = href if href.startswith("http") else (self.base_url.rstrip("/") + "/" + href.lstrip("/"))
+                    if full in seen:
                         continue
-                    lowered = (href + " " + text).lower()
-                    if "job" in lowered or "vacancy" in lowered or "circular" in lowered:
-                        full = href if href.startswith("http") else (self.base_url.rstrip("/") + "/" + href.lstrip("/"))
-                        if full in seen:
-                            continue
-                        seen.add(full)
-                        jobs.append({
-                            "title": text,
-                            "source_url": full,
-                            "source_site": "gov.bd",
-                            "posting_date": datetime.now().isoformat(),
-                            "description": "",
-                        })
+                    seen.add(full)
+                    jobs.append({
+                        "title": text,
+                        "source_url": full,
+                        "source_site": "gov.bd",
+                        "posting_date": self._run_ts,
+                        "description": "",
+                    })
 
                 # Limit results for demo/runtime sanity
                 jobs = jobs[:20]
@@ -97,49 +213,71 @@ class GovBDScraper(BaseScraper):
         
         return jobs
     
+    def _extract_detail_fields(self, tree, fallback_url: str) -> Dict:
+        """Apply the precompiled detail selectors to a parsed tree."""
+        apply_nodes = _SEL_APPLY(tree)
+        return {
+            'title': _first_text(_SEL_TITLE, tree),
+            'department': _first_text(_SEL_DEPARTMENT, tree),
+            'location': _first_text(_SEL_LOCATION, tree),
+            'description': _first_text(_SEL_DESCRIPTION, tree),
+            'deadline_date': _first_text(_SEL_DEADLINE, tree),
+            'application_link': apply_nodes[0].get('href') if apply_nodes else fallback_url,
+        }
+
+    async def _scrape_job_detail_http(self, job_link: Dict) -> Optional[Dict]:
+        """Scrape individual job details over plain HTTP.
+
+        Returns None when the markup lacks the expected selectors so the
+        caller can retry with the browser (client-side rendered page)."""
+        try:
+            async with self.session.get(job_link['url']) as resp:
+                if resp.status != 200:
+                    logger.warning(f"GovBD detail endpoint returned {resp.status}")
+                    return None
+                body = await resp.read()
+        except Exception as e:
+            logger.error(f"GovBD HTTP detail request failed: {e}")
+            return None
+
+        tree = lh.fromstring(body)
+        if not _SEL_TITLE(tree):
+            return None
+
+        job_data = self._extract_detail_fields(tree, job_link['url'])
+        job_data.update({
+            'source_url': job_link['url'],
+            'source_site': 'gov.bd',
+            'posting_date': self._run_ts
+        })
+        return job_data
+
     async def _scrape_job_detail(self, page: Page, job_link: Dict) -> Optional[Dict]:
         """Scrape individual job details (browser-driven)."""
         try:
-            await page.goto(job_link['url'], wait_until="networkidle")
-            
-            # Extract job data using page evaluation
-            job_data = await page.evaluate("""
-                    () => {
-                        const data = {};
-                        
-                        // Title
-                        const titleEl = document.querySelector('h1, .job-title, .title');
-                        data.title = titleEl ? titleEl.textContent.trim() : '';
-                        
-                        // Department
-                        const deptEl = document.querySelector('.department, .organization');
-                        data.department = deptEl ? deptEl.textContent.trim() : '';
-                        
-                        // Location
-                        const locEl = document.querySelector('.location, .workplace');
-                        data.location = locEl ? locEl.textContent.trim() : '';
-                        
-                        // Description
-                        const descEl = document.querySelector('.description, .job-description, .details');
-                        data.description = descEl ? descEl.textContent.trim() : '';
-                        
-                        // Deadline
-                        const deadlineEl = document.querySelector('.deadline, .last-date');
-                        data.deadline_date = deadlineEl ? deadlineEl.textContent.trim() : '';
-                        
-                        // Application link
-                        const applyEl = document.querySelector('a[href*="apply"], .apply-link');
-                        data.application_link = applyEl ? applyEl.href : window.location.href;
-                        
-                        return data;
-                    }
-                """)
-            
+            await page.goto(job_link['url'], wait_until="domcontentloaded")
+
+            # The evaluate below reads the title element directly; wait for it
+            # so a late-rendering page doesn't hand back empty fields
+            try:
+                await page.wait_for_selector("h1, .job-title, .title", timeout=5000)
+            except Exception:
+                pass  # fall through: the evaluate degrades to empty strings
+
+
+            # Pull the rendered HTML once and query it server-side with the
+            # precompiled selectors — one round-trip to the browser instead
+            # of a JS evaluation per page
+            content = await page.content()
+            tree = lh.fromstring(content)
+            job_data = self._extract_detail_fields(tree, page.url)
+
+
             # Add metadata
             job_data.update({
                 'source_url': job_link['url'],
                 'source_site': 'gov.bd',
-                'posting_date': datetime.now().isoformat()
+                'posting_date': self._run_ts
             })
             
             return job_data
@@ -150,9 +288,13 @@ class GovBDScraper(BaseScraper):
     
     async def _scrape_url(self, url: str) -> Dict:
         """Scrape specific URL implementation (browser-driven)."""
-        page = await self.browser.new_page()
+        page = await self.context.new_page()
+        page.set_default_navigation_timeout(15_000)
         try:
-            await page.goto(url, wait_until="networkidle")
+            response = await page.goto(url, wait_until="domcontentloaded")
+            # Client errors other than rate limiting won't heal on retry
+            if response and 400 <= response.status < 500 and response.status != 429:
+                raise NonRetryableScrapeError(f"HTTP {response.status} for {url}")
             # Implementation specific to URL structure
             return {}
         finally:
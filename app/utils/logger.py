@@ -8,10 +8,31 @@ from datetime import datetime
 from typing import Dict, Any
 import sys
 
+# orjson emits bytes from C and formats datetimes natively, which matters
+# here because format() runs once per log record
+try:
+    import orjson
+
+    def _dumps(entry: Dict[str, Any]) -> str:
+        return orjson.dumps(entry, option=orjson.OPT_NAIVE_UTC, default=str).decode()
+except ImportError:
+    def _dumps(entry: Dict[str, Any]) -> str:
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
 class JSONFormatter(logging.Formatter):
+    # Standard LogRecord attributes that are either already surfaced under a
+    # friendlier name in the entry or pure logging internals; anything else
+    # on the record came in via extra= and gets passed through
+    _SKIP = frozenset({
+        'args', 'msg', 'levelname', 'name', 'message', 'module', 'funcName',
+        'lineno', 'exc_info', 'exc_text', 'stack_info', 'created', 'msecs',
+        'relativeCreated', 'thread', 'threadName', 'processName', 'process',
+        'pathname', 'filename', 'levelno', 'taskName',
+    })
+
     def format(self, record: logging.LogRecord) -> str:
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -19,17 +40,18 @@ class JSONFormatter(logging.Formatter):
             "function": record.funcName,
             "line": record.lineno
         }
-        
+
         # Add exception info if present
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
-        
+
         # Add extra fields
+        skip = self._SKIP
         for key, value in record.__dict__.items():
-            if key not in log_entry and not key.startswith('_'):
+            if key not in skip and not key.startswith('_'):
                 log_entry[key] = value
-        
-        return json.dumps(log_entry, ensure_ascii=False)
+
+        return _dumps(log_entry)
 
 def setup_logging(log_level: str = "INFO", log_format: str = "json"):
     # Setup centralized logging configuration
@@ -10,7 +10,8 @@
 
 
 
-import requests
+import asyncio
+import httpx
 import sys
 import time
 import json
@@ -29,16 +30,18 @@ class HealthChecker:
     def __init__(self, base_url="http://localhost:8000", timeout=10):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
-        self.session = requests.Session()
-    
-    def check_health_endpoint(self):
+        # One pooled async client: probes reuse a single TCP/TLS connection
+        # and independent checks can run concurrently instead of serially
+        self.client = httpx.AsyncClient(base_url=self.base_url, timeout=timeout)
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def check_health_endpoint(self):
         # Check the main health endpoint
         try:
-            response = self.session.get(
-                f"{self.base_url}/health",
-                timeout=self.timeout
-            )
-            
+            response = await self.client.get("/health")
+
             if response.status_code == 200:
                 data = response.json()
                 logger.info("✅ Health endpoint: OK")
@@ -46,48 +49,43 @@ class HealthChecker:
             else:
                 logger.error(f"❌ Health endpoint returned {response.status_code}")
                 return False, {"error": f"HTTP {response.status_code}"}
-                
-        except requests.exceptions.RequestException as e:
+
+        except httpx.HTTPError as e:
             logger.error(f"❌ Health endpoint failed: {e}")
             return False, {"error": str(e)}
-    
-    def check_api_endpoints(self):
-        # Check critical API endpoints
+
+    async def check_api_endpoints(self):
+        # Check critical API endpoints, all probes in flight at once
         endpoints = [
             ("/jobs/", "Jobs listing"),
             ("/metrics", "Metrics"),
         ]
-        
+
+        responses = await asyncio.gather(
+            *(self.client.get(endpoint) for endpoint, _ in endpoints),
+            return_exceptions=True,
+        )
+
         results = {}
-        
-        for endpoint, description in endpoints:
-            try:
-                response = self.session.get(
-                    f"{self.base_url}{endpoint}",
-                    timeout=self.timeout
-                )
-                
-                if response.status_code == 200:
-                    logger.info(f"✅ {description}: OK")
-                    results[endpoint] = {"status": "ok", "response_time": response.elapsed.total_seconds()}
-                else:
-                    logger.error(f"❌ {description}: HTTP {response.status_code}")
-                    results[endpoint] = {"status": "error", "code": response.status_code}
-                    
-            except requests.exceptions.RequestException as e:
-                logger.error(f"❌ {description}: {e}")
-                results[endpoint] = {"status": "error", "error": str(e)}
-        
+
+        for (endpoint, description), response in zip(endpoints, responses):
+            if isinstance(response, BaseException):
+                logger.error(f"❌ {description}: {response}")
+                results[endpoint] = {"status": "error", "error": str(response)}
+            elif response.status_code == 200:
+                logger.info(f"✅ {description}: OK")
+                results[endpoint] = {"status": "ok", "response_time": response.elapsed.total_seconds()}
+            else:
+                logger.error(f"❌ {description}: HTTP {response.status_code}")
+                results[endpoint] = {"status": "error", "code": response.status_code}
+
         return results
-    
-    def check_database_health(self):
+
+    async def check_database_health(self):
         # Check database connectivity through metrics endpoint
         try:
-            response = self.session.get(
-                f"{self.base_url}/metrics",
-                timeout=self.timeout
-            )
-            
+            response = await self.client.get("/metrics")
+
             if response.status_code == 200:
                 data = response.json()
                 if 'total_jobs' in data and isinstance(data['total_jobs'], int):
@@ -99,40 +97,48 @@ class HealthChecker:
             else:
                 logger.error(f"❌ Database connectivity: HTTP {response.status_code}")
                 return False, {"error": f"HTTP {response.status_code}"}
-                
-        except requests.exceptions.RequestException as e:
+
+        except httpx.HTTPError as e:
             logger.error(f"❌ Database connectivity: {e}")
             return False, {"error": str(e)}
-    
-    def check_response_times(self):
-        # Check API response times
+
+    async def _timed_get(self, endpoint):
+        # Returns latency in ms for a 200 response, None otherwise
+        try:
+            start_time = time.perf_counter()
+            response = await self.client.get(endpoint)
+            elapsed = (time.perf_counter() - start_time) * 1000
+            if response.status_code == 200:
+                return elapsed
+        except httpx.HTTPError:
+            pass
+        return None
+
+    async def check_response_times(self):
+        # Check API response times; all 9 probes run concurrently so wall
+        # time is the slowest request, not the sum of them
         endpoints = ["/health", "/jobs/", "/metrics"]
+        samples_per_endpoint = 3
+
+        all_samples = await asyncio.gather(
+            *(self._timed_get(endpoint)
+              for endpoint in endpoints
+              for _ in range(samples_per_endpoint))
+        )
+
         response_times = {}
-        
-        for endpoint in endpoints:
-            times = []
-            for i in range(3):  # Test 3 times
-                try:
-                    start_time = time.time()
-                    response = self.session.get(
-                        f"{self.base_url}{endpoint}",
-                        timeout=self.timeout
-                    )
-                    end_time = time.time()
-                    
-                    if response.status_code == 200:
-                        times.append((end_time - start_time) * 1000)  # Convert to ms
-                    
-                except requests.exceptions.RequestException:
-                    pass
-            
+
+        for i, endpoint in enumerate(endpoints):
+            samples = all_samples[i * samples_per_endpoint:(i + 1) * samples_per_endpoint]
+            times = [t for t in samples if t is not None]
+
             if times:
                 avg_time = sum(times) / len(times)
                 response_times[endpoint] = {
                     "avg_ms": round(avg_time, 2),
                     "samples": len(times)
                 }
-                
+
                 if avg_time < 500:
                     logger.info(f"✅ {endpoint} response time: {avg_time:.0f}ms")
                 else:
@@ -140,59 +146,89 @@ class HealthChecker:
             else:
                 response_times[endpoint] = {"error": "No successful requests"}
                 logger.error(f"❌ {endpoint}: No successful requests")
-        
+
         return response_times
-    
-    def comprehensive_check(self):
+
+    async def comprehensive_check(self):
         # Run all health checks
         logger.info(f"🔍 Starting health check for {self.base_url}")
         start_time = datetime.now()
-        
+
         results = {
             "timestamp": start_time.isoformat(),
             "base_url": self.base_url,
             "checks": {}
         }
-        
+
         # Main health check
-        health_ok, health_data = self.check_health_endpoint()
+        health_ok, health_data = await self.check_health_endpoint()
         results["checks"]["health"] = {
             "status": "ok" if health_ok else "error",
             "data": health_data
         }
-        
+
         # API endpoints check
-        api_results = self.check_api_endpoints()
+        api_results = await self.check_api_endpoints()
         results["checks"]["api_endpoints"] = api_results
-        
+
         # Database check
-        db_ok, db_data = self.check_database_health()
+        db_ok, db_data = await self.check_database_health()
         results["checks"]["database"] = {
             "status": "ok" if db_ok else "error",
             "data": db_data
         }
-        
+
         # Response time check
-        response_times = self.check_response_times()
+        response_times = await self.check_response_times()
         results["checks"]["response_times"] = response_times
-        
+
         # Overall status
         all_checks_passed = (
-            health_ok and 
-            db_ok and 
+            health_ok and
+            db_ok and
             all(check.get("status") == "ok" for check in api_results.values())
         )
-        
+
         results["overall_status"] = "healthy" if all_checks_passed else "unhealthy"
         results["duration_seconds"] = (datetime.now() - start_time).total_seconds()
-        
+
         logger.info(f"🏁 Health check completed: {results['overall_status'].upper()}")
-        
+
         return results
 
+async def _amain(args):
+    checker = HealthChecker(base_url=args.url, timeout=args.timeout)
+
+    async def run_check():
+        results = await checker.comprehensive_check()
+
+        if args.json:
+            print(json.dumps(results, indent=2))
+
+        if args.fail_fast and results["overall_status"] != "healthy":
+            sys.exit(1)
+
+        return results["overall_status"] == "healthy"
+
+    try:
+        if args.continuous:
+            logger.info(f"🔄 Running continuous health checks every {args.continuous} seconds")
+            try:
+                while True:
+                    await run_check()
+                    await asyncio.sleep(args.continuous)
+            except KeyboardInterrupt:
+                logger.info("🛑 Continuous health check stopped")
+                sys.exit(0)
+        else:
+            success = await run_check()
+            sys.exit(0 if success else 1)
+    finally:
+        await checker.aclose()
+
 def main():
     parser = argparse.ArgumentParser(description="Health check for BD Jobs API")
-    parser.add_argument("--url", default="http://localhost:8000", 
+    parser.add_argument("--url", default="http://localhost:8000",
                        help="Base URL of the API")
     parser.add_argument("--timeout", type=int, default=10,
                        help="Request timeout in seconds")
@@ -202,34 +238,9 @@ def main():
                        help="Run continuously with specified interval")
     parser.add_argument("--fail-fast", action="store_true",
                        help="Exit with error code on first failure")
-    
+
     args = parser.parse_args()
-    
-    checker = HealthChecker(base_url=args.url, timeout=args.timeout)
-    
-    def run_check():
-        results = checker.comprehensive_check()
-        
-        if args.json:
-            print(json.dumps(results, indent=2))
-        
-        if args.fail_fast and results["overall_status"] != "healthy":
-            sys.exit(1)
-        
-        return results["overall_status"] == "healthy"
-    
-    if args.continuous:
-        logger.info(f"🔄 Running continuous health checks every {args.continuous} seconds")
-        try:
-            while True:
-                run_check()
-                time.sleep(args.continuous)
-        except KeyboardInterrupt:
-            logger.info("🛑 Continuous health check stopped")
-            sys.exit(0)
-    else:
-        success = run_check()
-        sys.exit(0 if success else 1)
+    asyncio.run(_amain(args))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
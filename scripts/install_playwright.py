@@ -18,13 +18,41 @@ environment (it's already listed in requirements.txt). The script uses
 the current Python interpreter to invoke `python -m playwright install`.
 """
 import argparse
-import shlex
-import subprocess
 import sys
 
+# Resolved once; sys.executable doesn't change during a run
+_PYTHON = sys.executable
+
+# Parser built at module scope so repeated CI invocations (--help, --dry-run
+# matrices) skip reconstructing it inside main(); subprocess/shlex import
+# lazily in the branches that need them
+parser = argparse.ArgumentParser(description="Install Playwright browsers for scrapers.")
+parser.add_argument(
+    "--browsers",
+    nargs="+",
+    choices=["chromium", "firefox", "webkit"],
+    default=["chromium"],
+    help="Which browsers to install (default: chromium)",
+)
+parser.add_argument(
+    "--with-deps",
+    action="store_true",
+    help="On Linux, also install system dependencies where supported",
+)
+parser.add_argument(
+    "--yes",
+    action="store_true",
+    help="Run non-interactively (confirm install)",
+)
+parser.add_argument(
+    "--dry-run",
+    action="store_true",
+    help="Print the command but don't execute it",
+)
+
 
 def build_command(browsers, with_deps: bool):
-    cmd = [sys.executable, "-m", "playwright", "install"]
+    cmd = [_PYTHON, "-m", "playwright", "install"]
     if browsers:
         # playwright install accepts space-separated browsers
         cmd.extend(browsers)
@@ -34,29 +62,7 @@ def build_command(browsers, with_deps: bool):
 
 
 def main() -> int:
-    parser = argparse.ArgumentParser(description="Install Playwright browsers for scrapers.")
-    parser.add_argument(
-        "--browsers",
-        nargs="+",
-        choices=["chromium", "firefox", "webkit"],
-        default=["chromium"],
-        help="Which browsers to install (default: chromium)",
-    )
-    parser.add_argument(
-        "--with-deps",
-        action="store_true",
-        help="On Linux, also install system dependencies where supported",
-    )
-    parser.add_argument(
-        "--yes",
-        action="store_true",
-        help="Run non-interactively (confirm install)",
-    )
-    parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Print the command but don't execute it",
-    )
+    import shlex
 
     args = parser.parse_args()
 
@@ -81,14 +87,15 @@ def main() -> int:
             return 1
 
     print("Running:", printable)
+    import os
     try:
-        subprocess.run(cmd, check=True)
-    except subprocess.CalledProcessError as exc:
-        print("Playwright install failed:", exc)
-        return exc.returncode or 2
-
-    print("Playwright browsers installed successfully.")
-    return 0
+        # exec replaces this process: playwright inherits stdio directly,
+        # the Python heap is freed, and the shell sees playwright's own
+        # exit status. Nothing after this line runs on success.
+        os.execvp(cmd[0], cmd)
+    except OSError as exc:
+        print("Playwright install failed to launch:", exc)
+        return 2
 
 
 if __name__ == "__main__":
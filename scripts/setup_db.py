@@ -1,48 +1,288 @@
 # =============================================================================
 # 23. Database Setup Script (scripts/setup_db.py)
 # =============================================================================
+import csv
+import functools
+import io
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
+
+# One resolve() instead of a chain of abspath/dirname stat calls
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
 
 from app.db.models import Base, User, Job
 from app.config import settings
 from sqlalchemy import text
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Below this row count the ORM loop is fine; above it, per-statement
+# parse/plan overhead dominates and COPY wins by 4-5x
+COPY_THRESHOLD = 100
+
+
+@functools.lru_cache(maxsize=1)
+def _get_sync_engine():
+    """One engine (and pool) shared by create_database and create_sample_data.
+
+    Strips the async driver suffix so setup always runs on the sync driver.
+    NullPool fits this workload: each DDL worker holds its connection
+    briefly and the process exits right after, so pooled idle connections
+    would only linger on the server with nobody to reuse them.
+    """
+    sync_db_url = settings.DATABASE_URL.replace('+asyncpg', '')
+    return create_engine(sync_db_url, poolclass=NullPool)
+
+
+def _array_literal(values):
+    """Pre-encode a Python list as a Postgres array literal.
+
+    Encoding once here means COPY ships ready-to-parse text and the server
+    parses it once per value — no driver-side codec work per row. Elements
+    are quoted so commas/braces/quotes in skill names survive the trip.
+    """
+    return '{' + ','.join(
+        '"' + str(v).replace('\\', '\\\\').replace('"', '\\"') + '"'
+        for v in values
+    ) + '}'
+
+
+def bulk_insert_with_copy(session, table_name, rows, columns):
+    """Stream rows into a table with COPY instead of per-row INSERTs.
+
+    ``rows`` is a list of dicts keyed by ``columns``. List values are
+    serialized as Postgres array literals; None becomes SQL NULL.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter='\t', quoting=csv.QUOTE_MINIMAL)
+    for row in rows:
+        writer.writerow([
+            _array_literal(value) if isinstance(value, (list, tuple))
+            else r'\N' if value is None
+            else value
+            for value in (row[column] for column in columns)
+        ])
+    buffer.seek(0)
+
+    # FORMAT csv so the server parses exactly what csv.writer produced;
+    # copy_from speaks COPY text format, which reads CSV quoting literally
+    # and backslashes as escape sequences
+    cursor = session.connection().connection.cursor()
+    cursor.copy_expert(
+        f"COPY {table_name} ({', '.join(columns)}) FROM STDIN "
+        "WITH (FORMAT csv, DELIMITER E'\\t', NULL '\\N')",
+        buffer,
+    )
+
+def _create_tables_parallel(engine):
+    """Create tables level-by-level, parallelizing within each level.
+
+    Tables with no outstanding FK dependencies are created together on
+    separate connections; catalog updates are I/O-bound so the wall time of
+    a level is its slowest table. Falls back to plain create_all on any
+    surprise (dialects without concurrent DDL, dependency cycles).
+    """
+    try:
+        remaining = list(Base.metadata.sorted_tables)
+        created = set()
+        while remaining:
+            level = [
+                table for table in remaining
+                if all(fk.column.table in created or fk.column.table is table
+                       for fk in table.foreign_keys)
+            ]
+            if not level:
+                raise RuntimeError("FK dependency cycle")
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                futures = [
+                    pool.submit(table.create, bind=engine, checkfirst=True)
+                    for table in level
+                ]
+                for future in futures:
+                    future.result()
+            created.update(level)
+            remaining = [table for table in remaining if table not in level]
+    except Exception as e:
+        logger.warning(f"Parallel table creation failed ({e}); falling back to create_all")
+        Base.metadata.create_all(bind=engine)
+
+
 def create_database():
     # Create database tables
     try:
         logger.info("Creating database tables...")
-        # Ensure we use a synchronous driver for setup (strip async driver suffix)
-        sync_db_url = settings.DATABASE_URL.replace('+asyncpg', '')
-        engine = create_engine(sync_db_url, pool_size=10, max_overflow=20)
+        engine = _get_sync_engine()
 
-        # Create tables using the sync engine
-        Base.metadata.create_all(bind=engine)
+        # Create tables using the sync engine, independent levels in parallel
+        _create_tables_parallel(engine)
         logger.info("Database tables created successfully")
 
         # Create indexes for performance (run outside transaction where necessary)
         conn = engine.connect()
         try:
             conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+
+            # One-time migration: convert a legacy JSON skills column to
+            # native text[] so the GIN index below can serve containment
+            # queries. No-op once the column is already an array.
             conn.execute(text("""
-                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_full_text 
-                ON jobs USING gin(to_tsvector('english', title || ' ' || description));
+                DO $$
+                BEGIN
+                    IF EXISTS (
+                        SELECT 1 FROM information_schema.columns
+                        WHERE table_name = 'jobs' AND column_name = 'skills'
+                          AND data_type IN ('json', 'jsonb')
+                    ) THEN
+                        -- ALTER ... USING can't run a subquery, so stage
+                        -- the conversion through a scratch column instead
+                        ALTER TABLE jobs ADD COLUMN skills_arr varchar(64)[];
+                        UPDATE jobs
+                            SET skills_arr = sub.arr
+                            FROM (
+                                SELECT j.id,
+                                       array_agg(value)::varchar(64)[] AS arr
+                                FROM jobs j
+                                CROSS JOIN LATERAL
+                                    json_array_elements_text(j.skills::json) AS value
+                                WHERE j.skills IS NOT NULL
+                                GROUP BY j.id
+                            ) sub
+                            WHERE jobs.id = sub.id;
+                        -- JSON '[]' yields no elements and so no sub row;
+                        -- give those rows an empty array, not NULL
+                        UPDATE jobs SET skills_arr = '{}'
+                            WHERE skills IS NOT NULL AND skills_arr IS NULL;
+                        ALTER TABLE jobs DROP COLUMN skills;
+                        ALTER TABLE jobs RENAME COLUMN skills_arr TO skills;
+                    END IF;
+                END $$;
             """))
 
+            # Pin the default text-search config so ad-hoc one-argument
+            # to_tsvector/tsquery calls resolve without a per-execution
+            # config lookup and always agree with the indexed expression.
+            # (The stored column below must keep the explicit two-argument
+            # form: only that one is IMMUTABLE.)
+            conn.execute(text("""
+                DO $$
+                BEGIN
+                    EXECUTE format(
+                        'ALTER DATABASE %I SET default_text_search_config = ''pg_catalog.english''',
+                        current_database());
+                END $$;
+            """))
+
+            # Stored tsvector column: rows tokenize once on write instead of
+            # per-query, and any `search_tsv @@ tsquery` predicate hits the
+            # GIN index regardless of how the query spells the expression.
+            # Covers all four searched fields so "Dhaka" or "Ministry of
+            # Education" match by location/department, same as the ILIKE
+            # fallback. A generated column's expression can't be altered in
+            # place, so databases carrying an older expression (missing
+            # location) drop and rebuild it first.
+            conn.execute(text("""
+                DO $$
+                DECLARE
+                    expr text;
+                BEGIN
+                    SELECT pg_get_expr(d.adbin, d.adrelid) INTO expr
+                    FROM pg_attrdef d
+                    JOIN pg_attribute a
+                        ON a.attrelid = d.adrelid AND a.attnum = d.adnum
+                    WHERE d.adrelid = 'jobs'::regclass
+                      AND a.attname = 'search_tsv';
+                    IF expr IS NOT NULL AND expr NOT LIKE '%location%' THEN
+                        ALTER TABLE jobs DROP COLUMN search_tsv;
+                    END IF;
+                END $$;
+            """))
             conn.execute(text("""
-                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_deadline_active 
-                ON jobs (deadline_date, is_active) WHERE is_active = true;
+                ALTER TABLE jobs ADD COLUMN IF NOT EXISTS search_tsv tsvector
+                GENERATED ALWAYS AS (
+                    to_tsvector('english',
+                        coalesce(title, '') || ' ' || coalesce(department, '') || ' ' ||
+                        coalesce(description, '') || ' ' || coalesce(location, ''))
+                ) STORED;
             """))
         finally:
             conn.close()
 
+        # CONCURRENTLY builds don't block each other (separate index files),
+        # so each runs on its own autocommit connection in parallel — wall
+        # time is the slowest build, not the sum of all four
+        index_ddls = [
+            # (ddl, is_gin) — GIN builds get a bigger maintenance_work_mem
+            ("""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_skills_gin
+                ON jobs USING gin(skills);
+            """, True),
+            # fastupdate=off keeps entries out of the GIN pending list, so
+            # search queries never stall on a mid-read flush; inserts pay a
+            # little more instead. The list limit only applies if fastupdate
+            # is ever re-enabled.
+            ("""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_search_tsv
+                ON jobs USING gin(search_tsv)
+                WITH (fastupdate = off, gin_pending_list_limit = 4096);
+            """, True),
+            # INCLUDE makes this covering for the listing endpoint: the
+            # columns the list view renders come straight off the index
+            # leaf pages (Index Only Scan) instead of a heap fetch per hit
+            ("""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_deadline_active
+                ON jobs (deadline_date, is_active)
+                INCLUDE (title, department, location, application_link)
+                WHERE is_active = true;
+            """, False),
+            # Partial composite for the hot listing query:
+            # WHERE is_active AND deadline_date >= now ORDER BY created_at DESC
+            ("""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_active_deadline_created
+                ON jobs (deadline_date, created_at DESC) WHERE is_active = true;
+            """, False),
+            # BRIN complements the partial B-tree: rows arrive roughly in
+            # deadline order, so block-range summaries stay tight. At ~1% of
+            # B-tree size it serves wide date-range scans (backfills,
+            # dashboards) from cache; the planner picks the B-tree for
+            # narrow ranges
+            ("""
+                CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_deadline_brin
+                ON jobs USING brin(deadline_date) WITH (pages_per_range = 32);
+            """, False),
+        ]
+
+        def _build_index(ddl, is_gin):
+            build_conn = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+            try:
+                # Index builds on a populated table can outlive any
+                # server-side statement timeout; disable it for this session
+                build_conn.exec_driver_sql("SET statement_timeout = 0")
+                if is_gin:
+                    build_conn.execute(text("SET maintenance_work_mem = '1GB'"))
+                build_conn.execute(text(ddl))
+            finally:
+                build_conn.close()
+
+        with ThreadPoolExecutor(max_workers=len(index_ddls)) as pool:
+            futures = [pool.submit(_build_index, ddl, is_gin) for ddl, is_gin in index_ddls]
+            for future in futures:
+                future.result()
+
+        # Superseded by idx_jobs_search_tsv; dropped only after the
+        # replacement is in place so search stays indexed throughout
+        drop_conn = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+        try:
+            drop_conn.execute(text("DROP INDEX CONCURRENTLY IF EXISTS idx_jobs_full_text;"))
+        finally:
+            drop_conn.close()
+
         logger.info("Additional indexes created")
     except Exception as e:
         logger.error(f"Database setup failed: {e}")
@@ -51,9 +291,8 @@ def create_database():
 def create_sample_data():
     # reate sample data for testing
     try:
-        # Use a local synchronous session for inserting sample data
-        sync_db_url = settings.DATABASE_URL.replace('+asyncpg', '')
-        engine = create_engine(sync_db_url)
+        # Reuse the shared setup engine rather than building a second pool
+        engine = _get_sync_engine()
         SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
         with SessionLocal() as db:
@@ -66,7 +305,7 @@ def create_sample_data():
             
             # Create sample jobs
             sample_jobs = [
-                Job(
+                dict(
                     job_id="sample_job_1",
                     title="Software Engineer",
                     department="ICT Division",
@@ -79,7 +318,7 @@ def create_sample_data():
                     application_link="https://example.com/apply/1",
                     source_site="gov.bd"
                 ),
-                Job(
+                dict(
                     job_id="sample_job_2",
                     title="Civil Engineer",
                     department="Roads and Highways",
@@ -94,9 +333,15 @@ def create_sample_data():
                 )
             ]
             
-            for job in sample_jobs:
-                db.add(job)
-            
+            if (len(sample_jobs) >= COPY_THRESHOLD
+                    and db.get_bind().dialect.name == "postgresql"):
+                columns = list(sample_jobs[0])
+                bulk_insert_with_copy(db, 'jobs', sample_jobs, columns)
+            else:
+                # Core-level insert: one executemany, no per-object ORM
+                # identity-map bookkeeping
+                db.execute(Job.__table__.insert(), sample_jobs)
+
             db.commit()
             logger.info("Sample data created successfully")
             
@@ -72,16 +72,18 @@ async def test_find_matching_jobs(sample_alert, sample_jobs):
     
     with patch('app.db.database.db_manager.get_session') as mock_session:
         mock_db = Mock()
+        mock_db.get_bind.return_value.dialect.name = "postgresql"
         mock_session.return_value.__enter__.return_value = mock_db
-        
+
         # Mock query chain
         mock_query = Mock()
         mock_query.filter.return_value = mock_query
         mock_query.limit.return_value.all.return_value = [sample_jobs[0]]
         mock_db.query.return_value = mock_query
         
+        now = datetime.utcnow()
         matching_jobs = await alert_service._find_matching_jobs(
-            mock_db, sample_alert, datetime.utcnow() - timedelta(days=1)
+            mock_db, sample_alert, now - timedelta(days=1), now
         )
         
         assert len(matching_jobs) >= 0
@@ -89,17 +91,12 @@ async def test_find_matching_jobs(sample_alert, sample_jobs):
 @pytest.mark.asyncio
 async def test_send_email_alert(sample_alert, sample_jobs, sample_user):
     alert_service = AlertService()
-    
-    with patch('smtplib.SMTP') as mock_smtp:
-        with patch('app.db.database.db_manager.get_session') as mock_session:
-            mock_db = Mock()
-            mock_db.query.return_value.filter.return_value.first.return_value = sample_user
-            mock_session.return_value.__enter__.return_value = mock_db
-            
-            await alert_service._send_email_alert(sample_alert, sample_jobs[:1])
-            
-            # Verify SMTP was called
-            mock_smtp.assert_called()
+
+    mock_server = Mock()
+    alert_service._send_email_alert(mock_server, sample_user.email, sample_jobs[:1])
+
+    # Message goes out over an already-connected server
+    mock_server.send_message.assert_called_once()
 
 def test_job_scheduler_initialization():
     scheduler = JobScheduler()
@@ -2,6 +2,9 @@
 # 20. Complete Test Suite (tests/test_scrapers.py)
 # =============================================================================
 
+import csv
+import io
+
 import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch
@@ -51,6 +54,42 @@ async def test_scraper_manager():
         jobs = await manager.scrape_all_sources()
         assert len(jobs) >= 0  # May be 0 if parsing fails
 
+def test_save_copy_payload_round_trips_quotes_and_backslashes():
+    # The COPY statement must declare CSV format and the payload must parse
+    # back to the original values under CSV rules — the same parse the
+    # server applies — including quotes, backslashes, tabs and the NULL
+    # sentinel
+    manager = ScraperManager()
+    rows = [
+        {'job_id': 'j1', 'title': 'He said "apply now" today',
+         'description': 'path C:\\temp\\new', 'skills': ['c++', 'sql']},
+        {'job_id': 'j2', 'title': 'tab\there', 'description': None,
+         'skills': []},
+    ]
+    captured = {}
+
+    class FakeCursor:
+        rowcount = len(rows)
+
+        def execute(self, sql):
+            pass
+
+        def copy_expert(self, sql, buf):
+            captured['sql'] = sql
+            captured['payload'] = buf.read()
+
+    session = Mock()
+    session.connection.return_value.connection.cursor.return_value = FakeCursor()
+
+    manager._save_copy(session, rows)
+
+    assert 'FORMAT csv' in captured['sql']
+    parsed = list(csv.reader(io.StringIO(captured['payload']), delimiter='\t'))
+    assert parsed[0][1] == 'He said "apply now" today'
+    assert parsed[0][2] == 'path C:\\temp\\new'
+    assert parsed[1][1] == 'tab\there'
+    assert parsed[1][2] == r'\N'  # None arrives as the unquoted NULL sentinel
+
 def test_skill_extraction():
     parser = JobParser()
     text = "Must have Python programming skills and Microsoft Office knowledge"